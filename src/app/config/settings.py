@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Mapping, Tuple
 
 
 @dataclass(frozen=True)
@@ -86,19 +86,20 @@ class Settings:
         return self.max_upload_size_mb * 1024 * 1024
 
 
-def get_settings() -> Settings:
-    """Provide application settings, adapting storage for Azure deployments."""
+def resolve_data_dir(env: Mapping[str, str]) -> Path:
+    """Return the storage directory configured by ``env``, adapting to Azure deployments."""
 
-    settings = Settings()
-    upload_dir = os.getenv("UPLOAD_DIR")
+    upload_dir = env.get("UPLOAD_DIR")
     if upload_dir:
-        data_dir = Path(upload_dir).expanduser()
-        return replace(settings, data_dir=data_dir)
+        return Path(upload_dir).expanduser()
+
+    if env.get("WEBSITE_INSTANCE_ID"):
+        return Path(env.get("APP_DATA_DIR", "/home/site/data")).expanduser()
+
+    return Settings.data_dir
 
-    if os.getenv("WEBSITE_INSTANCE_ID"):
-        persistent_dir = Path(
-            os.getenv("APP_DATA_DIR", "/home/site/data")
-        ).expanduser()
-        return replace(settings, data_dir=persistent_dir)
 
-    return settings
+def get_settings() -> Settings:
+    """Provide application settings, adapting storage for Azure deployments."""
+
+    return Settings(data_dir=resolve_data_dir(os.environ))
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Iterable, List, Mapping
+from typing import Any, Iterable, Mapping, Sequence
 
 
 @dataclass(frozen=True)
@@ -10,7 +10,7 @@ class DocumentPage:
     """Represents a single page extracted from an uploaded document."""
 
     number: int
-    content: List[str] = field(default_factory=list)
+    content: Sequence[str] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable representation of the page."""
@@ -44,7 +44,7 @@ class DocumentPage:
 class ParsedDocument:
     """Represents the parsed content of an uploaded document."""
 
-    pages: List[DocumentPage] = field(default_factory=list)
+    pages: Sequence[DocumentPage] = field(default_factory=list)
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable representation of the document."""
@@ -123,12 +123,7 @@ class RealTajoMatch:
         """Create a match instance from a dictionary representation."""
 
         raw_date = data.get("date")
-        parsed_date: Optional[date] = None
-        if isinstance(raw_date, str):
-            try:
-                parsed_date = datetime.strptime(raw_date, "%Y-%m-%d").date()
-            except ValueError:
-                parsed_date = None
+        parsed_date = _parse_optional_date(raw_date) if isinstance(raw_date, str) else None
 
         matchday_value = data.get("matchday")
         try:
@@ -147,6 +142,23 @@ class RealTajoMatch:
         )
 
 
+def _parse_optional_date(value: str) -> Optional[date]:
+    """Return the ``date`` encoded in ``value`` or ``None`` when it is not a valid date."""
+
+    # ``fromisoformat`` also accepts basic and week formats on Python 3.11+,
+    # so it is only used for strict ``YYYY-MM-DD`` input.
+    if len(value) == 10 and value[4] == value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    # Fall back to strptime for non zero-padded values such as ``2025-1-5``.
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
 def _sanitize_optional_str(value: object) -> Optional[str]:
     """Return ``value`` as a trimmed string when it is a meaningful value."""
 
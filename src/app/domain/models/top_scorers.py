@@ -15,7 +15,7 @@ _COLUMN_STRUCTURE: List[dict[str, Any]] = [
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopScorerEntry:
     """Represent a single player's scoring statistics within the table."""
 
@@ -65,7 +65,7 @@ class TopScorerEntry:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopScorersTable:
     """Represent an extracted top scorers table."""
 
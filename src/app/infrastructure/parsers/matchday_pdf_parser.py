@@ -20,6 +20,7 @@ _SCORE_ONLY_RE = re.compile(r"^(?P<home>\d+)\s*-\s*(?P<away>\d+)$")
 _TEAM_WITH_TRAILING_SCORE_RE = re.compile(
     r"^(?P<team>.+?)\s+(?P<home_score>\d+)\s*-\s*(?P<away_score>\d+)$"
 )
+_MATCHDAY_NUMBER_RE = re.compile(r"jornada\s+(\d+)", re.IGNORECASE)
 _DATE_RE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
 _TIME_RE = re.compile(r"\b\d{1,2}:\d{2}\b")
 _HEADER_PREFIXES = (
@@ -76,7 +77,7 @@ class MatchdayPdfParser(MatchdayParser):
         """Return the matchday number detected within the document lines."""
 
         for line in lines:
-            match = re.search(r"jornada\s+(\d+)", line, re.IGNORECASE)
+            match = _MATCHDAY_NUMBER_RE.search(line)
             if match:
                 return int(match.group(1))
         raise ValueError("The matchday number could not be determined from the document.")
@@ -182,14 +183,19 @@ class MatchdayPdfParser(MatchdayParser):
             if any(lower_line.startswith(prefix) for prefix in _HEADER_PREFIXES):
                 continue
 
-            date_match = _DATE_RE.search(line)
+            # Cheap character checks gate the regexes: every score pattern
+            # needs a dash, dates need a separator and times need a colon.
+            has_dash = "-" in line
+            ends_with_digit = line[-1].isdigit()
+
+            date_match = _DATE_RE.search(line) if has_dash or "/" in line else None
             if date_match:
                 pending_date = self._normalise_date(date_match.group(0))
-            time_match = _TIME_RE.search(line)
+            time_match = _TIME_RE.search(line) if ":" in line else None
             if time_match:
                 pending_time = time_match.group(0)
 
-            inline_match = _INLINE_RESULT_RE.match(line)
+            inline_match = _INLINE_RESULT_RE.match(line) if has_dash else None
             if inline_match:
                 consume_team_buffer()
                 finalize_fixture()
@@ -213,7 +219,11 @@ class MatchdayPdfParser(MatchdayParser):
                 pending_time = None
                 continue
 
-            trailing_score_match = _TEAM_WITH_TRAILING_SCORE_RE.match(line)
+            trailing_score_match = (
+                _TEAM_WITH_TRAILING_SCORE_RE.match(line)
+                if has_dash and ends_with_digit
+                else None
+            )
             if trailing_score_match:
                 consume_team_buffer()
                 team_name = self._normalise_team_name([
@@ -240,7 +250,11 @@ class MatchdayPdfParser(MatchdayParser):
                 consume_team_buffer()
                 continue
 
-            score_match = _SCORE_ONLY_RE.match(line)
+            score_match = (
+                _SCORE_ONLY_RE.match(line)
+                if has_dash and ends_with_digit and line[0].isdigit()
+                else None
+            )
             if score_match:
                 consume_team_buffer(on_score_line=True)
                 if pending_home is None and pending_away is None:
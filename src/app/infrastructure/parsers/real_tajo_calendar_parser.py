@@ -84,6 +84,7 @@ def _extract_competition_and_season(lines: Sequence[str]) -> Tuple[Optional[str]
 
 
 TEAM_LINE_PATTERN = re.compile(r"^(\d+)\.\-\s+(.+)$")
+TEAM_CODE_SUFFIX_PATTERN = re.compile(r"\s*\(\d+\)\s*$")
 
 
 @dataclass(frozen=True)
@@ -144,14 +145,14 @@ def _extract_team_names(lines: Sequence[str]) -> List[str]:
 def _looks_like_complete_entry(line: str) -> bool:
     """Return ``True`` when ``line`` finishes a team entry."""
 
-    return bool(re.search(r"\(\d+\)\s*$", line))
+    return TEAM_CODE_SUFFIX_PATTERN.search(line) is not None
 
 
 def _append_team_name(team_names: List[str], parts: List[str]) -> None:
     """Append the normalized team name composed of ``parts`` into ``team_names``."""
 
     raw_name = " ".join(parts).strip()
-    normalized = re.sub(r"\s*\(\d+\)\s*$", "", raw_name).strip()
+    normalized = TEAM_CODE_SUFFIX_PATTERN.sub("", raw_name).strip()
     if normalized:
         team_names.append(normalized)
 
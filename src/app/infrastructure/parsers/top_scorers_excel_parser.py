@@ -2,27 +2,40 @@
 from __future__ import annotations
 
 import re
+import sys
+from functools import lru_cache
 from html import unescape
 from html.parser import HTMLParser
 from importlib import import_module
+from itertools import islice
 from io import BytesIO
-from typing import Any, Callable, Dict, Iterable, List, Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
 
 from openpyxl import load_workbook
 
+_PENALTIES_RE = re.compile(r"(\d+)\s*de\s*penalti", re.IGNORECASE)
+_NUMBER_RE = re.compile(r"\d+")
+
+# Optional spreadsheet backends probed once at import time by
+# ``_build_xls_loaders`` and ``_build_calamine_loader``, never per parse.
+_XLRD_MODULES = ("xlrd", "xlrd3")
+_PYEXCEL_MODULE = "pyexcel_xls"
+_CALAMINE_MODULE = "python_calamine"
+
+
 def _parse_version_tuple(raw_version: str) -> tuple[int, ...]:
     """Return a tuple with the numeric portions of ``raw_version``."""
 
-    parts = re.findall(r"\d+", raw_version)
+    parts = _NUMBER_RE.findall(raw_version)
     return tuple(int(part) for part in parts)
 
 
-def _build_xls_loaders() -> List[Callable[[bytes], List[List[Any]]]]:
-    """Return XLS loader callables using the available optional dependencies."""
+def _build_xls_loaders() -> List[Callable[[bytes], Iterable[List[Any]]]]:
+    """Return legacy XLS loader callables using the available optional dependencies."""
 
-    loaders: List[Callable[[bytes], List[List[Any]]]] = []
+    loaders: List[Callable[[bytes], Iterable[List[Any]]]] = []
 
-    for module_name in ("xlrd", "xlrd3"):
+    for module_name in _XLRD_MODULES:
         try:  # pragma: no cover - depends on optional runtime dependencies
             module = import_module(module_name)
         except Exception:  # pragma: no cover - module not installed or unusable
@@ -39,25 +52,21 @@ def _build_xls_loaders() -> List[Callable[[bytes], List[List[Any]]]]:
 
         def _load_with_xlrd(
             document_bytes: bytes, *, _module: Any = module
-        ) -> List[List[Any]]:
+        ) -> Iterable[List[Any]]:
             book = _module.open_workbook(file_contents=document_bytes)
             sheet = book.sheet_by_index(0)
-            total_columns = getattr(sheet, "ncols", 0)
-            rows: List[List[Any]] = []
-            for index in range(sheet.nrows):
-                if total_columns:
-                    values = list(sheet.row_values(index, end_colx=total_columns))
-                    if len(values) < total_columns:
-                        values.extend([""] * (total_columns - len(values)))
-                else:
-                    values = list(sheet.row_values(index))
-                rows.append(values)
-            return rows
+            total_columns = getattr(sheet, "ncols", 0) or None
+            # ``row_values`` already returns a fresh list spanning every
+            # column, so rows are streamed instead of copied and padded.
+            return (
+                sheet.row_values(index, 0, total_columns)
+                for index in range(sheet.nrows)
+            )
 
         loaders.append(_load_with_xlrd)
 
     try:  # pragma: no cover - depends on optional runtime dependencies
-        pyexcel_module = import_module("pyexcel_xls")
+        pyexcel_module = import_module(_PYEXCEL_MODULE)
     except Exception:  # pragma: no cover - module not installed or unusable
         pyexcel_module = None
 
@@ -81,34 +90,30 @@ def _build_xls_loaders() -> List[Callable[[bytes], List[List[Any]]]]:
 
             loaders.append(_load_with_pyexcel)
 
-    def _load_with_html(document_bytes: bytes) -> List[List[Any]]:
-        """Return rows extracted from HTML tables masquerading as XLS files."""
+    return loaders
+
 
-        text = _decode_html_document(document_bytes)
-        if text is None:
-            raise ValueError("The provided document is not an HTML table.")
+def _build_calamine_loader() -> Optional[Callable[[BinaryIO], List[List[Any]]]]:
+    """Return a ``python-calamine`` XLSX/XLS loader when the optional package is installed."""
 
-        parser = _HTMLTableParser()
-        parser.feed(text)
-        parser.close()
-        if not parser.rows:
-            raise ValueError("No tables were found in the HTML document.")
+    try:  # pragma: no cover - depends on optional runtime dependencies
+        module = import_module(_CALAMINE_MODULE)
+    except Exception:  # pragma: no cover - module not installed or unusable
+        return None
 
-        max_length = max((len(row) for row in parser.rows), default=0)
-        normalised: List[List[Any]] = []
-        for row in parser.rows:
-            values = list(row)
-            if max_length and len(values) < max_length:
-                values.extend([""] * (max_length - len(values)))
-            normalised.append(values)
-        return normalised
+    workbook_class = getattr(module, "CalamineWorkbook", None)
+    if workbook_class is None:
+        return None
 
-    loaders.append(_load_with_html)
+    def _load_with_calamine(stream: BinaryIO) -> List[List[Any]]:
+        workbook = workbook_class.from_filelike(stream)
+        return workbook.get_sheet_by_index(0).to_python()
 
-    return loaders
+    return _load_with_calamine
 
 
 _XLS_LOADERS = _build_xls_loaders()
+_CALAMINE_LOADER = _build_calamine_loader()
 
 from app.domain.models.top_scorers import TopScorerEntry, TopScorersTable
 
@@ -119,10 +124,21 @@ _HEADER_ALIASES: Dict[str, set[str]] = {
     "group": {"grupo"},
     "matches": {"partidos", "partidos jugados"},
     "goals": {"goles"},
-    "ratio": {"goles partido", "goles/partido", "goles por partido"},
+    "ratio": {"goles partido", "goles por partido"},
 }
-_PENALTIES_RE = re.compile(r"(\d+)\s*de\s*penalti", re.IGNORECASE)
-_NUMBER_RE = re.compile(r"\d+")
+# Header separators folded into spaces; str.split() already covers NBSP.
+_HEADER_TRANSLATION = str.maketrans({"/": " "})
+_DECIMAL_TRANSLATION = str.maketrans({",": "."})
+_ZIP_SIGNATURE = b"PK\x03\x04"
+_OLE_SIGNATURE = b"\xd0\xcf\x11\xe0"
+# Only labels shorter than this are interned when building scorer entries.
+_INTERN_MAX_LENGTH = 128
+_UTF8_BOM = b"\xef\xbb\xbf"
+# Lowercased openings of HTML documents exported with an ``.xls`` extension.
+_MARKUP_PREFIXES = (b"<html", b"<!doc", b"<tabl")
+# Leading bytes read to sniff the format, enough to skip a BOM and blank lines.
+_SNIFF_LENGTH = 512
+_TABLE_MARKER_RE = re.compile(r"<table", re.IGNORECASE)
 
 
 def _decode_html_document(document_bytes: bytes) -> Optional[str]:
@@ -137,15 +153,13 @@ def _decode_html_document(document_bytes: bytes) -> Optional[str]:
         "latin-1",
         "windows-1252",
     )
-    marker = "<table"
 
     for encoding in candidates:
         try:
             text = document_bytes.decode(encoding)
         except UnicodeDecodeError:
             continue
-        lower_text = text.lower()
-        if marker in lower_text:
+        if _TABLE_MARKER_RE.search(text):
             return text
     return None
 
@@ -271,6 +285,28 @@ class _HTMLTableParser(HTMLParser):
 
 
 
+def _load_with_html(document_bytes: bytes) -> List[List[Any]]:
+    """Return rows extracted from HTML tables masquerading as XLS files."""
+
+    text = _decode_html_document(document_bytes)
+    if text is None:
+        raise ValueError("The provided document is not an HTML table.")
+
+    parser = _HTMLTableParser()
+    parser.feed(text)
+    parser.close()
+    if not parser.rows:
+        raise ValueError("No tables were found in the HTML document.")
+
+    # The parser owns its row lists, so they are padded in place.
+    rows: List[List[Any]] = parser.rows
+    max_length = max((len(row) for row in rows), default=0)
+    for row in rows:
+        if len(row) < max_length:
+            row.extend([""] * (max_length - len(row)))
+    return rows
+
+
 def _stringify(value: Any) -> str:
     """Return a trimmed string representation for ``value`` suitable for JSON."""
 
@@ -284,7 +320,7 @@ def _stringify(value: Any) -> str:
 def _normalize_header(value: Any) -> str:
     """Return a normalised lowercase header representation."""
 
-    return " ".join(_stringify(value).lower().split())
+    return " ".join(_stringify(value).translate(_HEADER_TRANSLATION).lower().split())
 
 
 def _row_is_empty(row: Iterable[Any]) -> bool:
@@ -293,41 +329,113 @@ def _row_is_empty(row: Iterable[Any]) -> bool:
     return all(not _stringify(cell) for cell in row)
 
 
-def _load_excel_rows(document_bytes: bytes) -> List[List[Any]]:
-    """Load spreadsheet rows using ``openpyxl`` with optional XLS fallbacks."""
+def _read_document_bytes(document: bytes | BinaryIO, position: int) -> bytes:
+    """Return the contents of ``document`` from ``position`` for the byte-based loaders."""
+
+    if isinstance(document, (bytes, bytearray)):
+        return bytes(document)
+    document.seek(position)
+    return document.read()
+
+
+def _looks_like_markup(head: bytes) -> bool:
+    """Return ``True`` when ``head`` opens like an HTML document or table."""
+
+    return head.removeprefix(_UTF8_BOM).lstrip().lower().startswith(_MARKUP_PREFIXES)
+
+
+def _load_with_loaders(
+    document_bytes: bytes,
+    loaders: Iterable[Callable[[bytes], Iterable[List[Any]]]],
+    cause: Optional[Exception] = None,
+) -> List[List[Any]]:
+    """Return rows from the first of ``loaders`` accepting ``document_bytes``."""
+
+    errors: List[Exception] = []
+    for loader in loaders:
+        try:
+            return list(loader(document_bytes))
+        except Exception as loader_error:  # pragma: no cover - defensive fallback path
+            errors.append(loader_error)
+    root_error = errors[-1] if errors else cause
+    raise ValueError("The provided Excel file could not be parsed.") from root_error
+
+
+def _load_excel_rows(document: bytes | BinaryIO) -> List[List[Any]]:
+    """Load spreadsheet rows using ``openpyxl`` with optional XLS fallbacks.
+
+    The leading bytes pick the loader: ZIP packages go to ``openpyxl``, OLE
+    documents to the legacy XLS loaders and markup straight to the HTML
+    table loader. Anything else tries the XLS loaders and then the HTML one.
+    When ``python-calamine`` is installed it is tried first for ZIP and OLE
+    documents. Every loader reads the first sheet, whichever tab was active
+    when the workbook was saved. Streams are read from their current
+    position; binary streams are handed to the loaders as they are and only
+    raw bytes are wrapped in a ``BytesIO``.
+    """
+
+    stream = BytesIO(document) if isinstance(document, (bytes, bytearray)) else document
+    position = stream.tell()
+    head = stream.read(_SNIFF_LENGTH)
+    stream.seek(position)
+    signature = head[: len(_ZIP_SIGNATURE)]
+
+    if _CALAMINE_LOADER is not None and signature in (_ZIP_SIGNATURE, _OLE_SIGNATURE):
+        try:
+            return _CALAMINE_LOADER(stream)
+        except Exception:  # pragma: no cover - fall back to the bundled loaders
+            stream.seek(position)
+    if signature == _OLE_SIGNATURE:
+        return _load_with_loaders(_read_document_bytes(document, position), _XLS_LOADERS)
+    if signature != _ZIP_SIGNATURE:
+        document_bytes = _read_document_bytes(document, position)
+        if _looks_like_markup(head):
+            return _load_with_loaders(document_bytes, (_load_with_html,))
+        return _load_with_loaders(document_bytes, (*_XLS_LOADERS, _load_with_html))
 
-    stream = BytesIO(document_bytes)
     try:
         workbook = load_workbook(stream, data_only=True, read_only=True)
-    except Exception as openpyxl_error:  # pragma: no cover - exercised in XLS fallback
-        errors: List[Exception] = []
-        for loader in _XLS_LOADERS:
-            try:
-                return loader(document_bytes)
-            except Exception as loader_error:  # pragma: no cover - defensive fallback path
-                errors.append(loader_error)
-        root_error = errors[-1] if errors else openpyxl_error
-        raise ValueError("The provided Excel file could not be parsed.") from root_error
-    else:
-        worksheet = workbook.active
+    except Exception as openpyxl_error:  # pragma: no cover - corrupt XLSX packages
+        return _load_with_loaders(
+            _read_document_bytes(document, position),
+            (*_XLS_LOADERS, _load_with_html),
+            openpyxl_error,
+        )
+    try:
+        worksheet = workbook.worksheets[0]
         return [list(row) for row in worksheet.iter_rows(values_only=True)]
+    finally:
+        # Read-only workbooks keep the archive open until explicitly closed.
+        workbook.close()
+
+
+def _resolve_columns(header: List[str]) -> Optional[tuple[int, ...]]:
+    """Return column indices for ``header`` in ``_HEADER_ALIASES`` order.
 
+    ``None`` is returned when any logical column is missing.
+    """
+
+    columns: List[int] = []
+    for aliases in _HEADER_ALIASES.values():
+        col_index = next(
+            (position for position, cell in enumerate(header) if cell in aliases),
+            None,
+        )
+        if col_index is None:
+            return None
+        columns.append(col_index)
+    return tuple(columns)
 
-def _locate_header(rows: List[List[Any]]) -> tuple[int, Dict[str, int]]:
-    """Return the header row index plus a mapping between logical and column indices."""
+
+def _locate_header(rows: List[List[Any]]) -> tuple[int, tuple[int, ...]]:
+    """Return the header row index plus the column index of each logical field."""
 
     for index, row in enumerate(rows):
         if _row_is_empty(row):
             continue
-        normalised = [_normalize_header(cell) for cell in row]
-        mapping: Dict[str, int] = {}
-        for key, aliases in _HEADER_ALIASES.items():
-            for col_index, cell in enumerate(normalised):
-                if cell in aliases:
-                    mapping[key] = col_index
-                    break
-        if len(mapping) == len(_HEADER_ALIASES):
-            return index, mapping
+        columns = _resolve_columns([_normalize_header(cell) for cell in row])
+        if columns is not None:
+            return index, columns
     raise ValueError("The Excel sheet does not contain the expected scorer headers.")
 
 
@@ -371,6 +479,15 @@ def _extract_metadata(rows: Iterable[List[Any]]) -> tuple[Optional[str], Optiona
     return title or None, competition, category, season
 
 
+def _normalize_decimal(text: str) -> str:
+    """Return ``text`` with decimal commas turned into dots.
+
+    Most cells carry no comma at all and are returned untouched.
+    """
+
+    return text.translate(_DECIMAL_TRANSLATION) if "," in text else text
+
+
 def _parse_int_cell(value: Any) -> Optional[int]:
     """Return an integer extracted from ``value`` when possible."""
 
@@ -381,21 +498,32 @@ def _parse_int_cell(value: Any) -> Optional[int]:
         return int(text)
     except ValueError:
         try:
-            return int(float(text.replace(",", ".")))
+            return int(float(_normalize_decimal(text)))
         except ValueError:
             return None
 
 
+@lru_cache(maxsize=4096)
+def _to_ratio(text: str) -> Optional[float]:
+    """Return ``text`` as a float accepting comma decimals, or ``None``.
+
+    Ratio columns repeat the same few values across rows, so conversions are
+    memoised per distinct string.
+    """
+
+    try:
+        return float(_normalize_decimal(text))
+    except ValueError:
+        return None
+
+
 def _parse_ratio_cell(value: Any) -> Optional[float]:
     """Return a float extracted from ``value`` when possible."""
 
     text = _stringify(value)
     if not text:
         return None
-    try:
-        return float(text.replace(",", "."))
-    except ValueError:
-        return None
+    return _to_ratio(text)
 
 
 def _parse_goals_cell(value: Any) -> tuple[Optional[int], Optional[int], Optional[str]]:
@@ -405,84 +533,143 @@ def _parse_goals_cell(value: Any) -> tuple[Optional[int], Optional[int], Optiona
     if not text:
         return None, None, None
 
-    match = _PENALTIES_RE.search(text)
-    penalties = int(match.group(1)) if match else None
-    numbers = _NUMBER_RE.findall(text)
-    total = int(numbers[0]) if numbers else None
+    # Fast path for the usual ``"5"`` and ``"5 (2 de penalti)"`` layouts.
+    head, separator, tail = text.partition("(")
+    head = head.strip()
+    total = int(head) if head.isdecimal() else None
+    penalties: Optional[int] = None
+    if separator:
+        count, _, rest = tail.lstrip().partition(" ")
+        if count.isdecimal() and rest.lstrip().lower().startswith("de penalti"):
+            penalties = int(count)
+
+    if total is None or (penalties is None and "penalti" in text.lower()):
+        match = _PENALTIES_RE.search(text)
+        penalties = int(match.group(1)) if match else None
+        number = _NUMBER_RE.search(text)
+        total = int(number.group()) if number else None
     details = text if text else (str(total) if total is not None else None)
     return total, penalties, details
 
 
-class TopScorersExcelParser:
-    """Decode top scorers information from uploaded Excel spreadsheets."""
+def _intern_label(value: str) -> str:
+    """Return ``value`` interned when it is short enough to be a sheet label.
 
-    def parse(self, document_bytes: bytes) -> TopScorersTable:
-        """Parse ``document_bytes`` into a :class:`TopScorersTable` instance."""
+    Interned strings may never be freed, so long uploaded values are kept as is.
+    """
 
-        rows = _load_excel_rows(document_bytes)
-        if not rows:
-            raise ValueError("The Excel sheet does not contain any data.")
+    return sys.intern(value) if len(value) < _INTERN_MAX_LENGTH else value
 
-        header_index, mapping = _locate_header(rows)
-        title, competition, category, season = _extract_metadata(rows[:header_index])
 
-        scorers: List[TopScorerEntry] = []
-        for raw_row in rows[header_index + 1 :]:
-            if _row_is_empty(raw_row):
-                continue
+def _load_scorer_sheet(document: bytes | BinaryIO) -> tuple[List[List[Any]], int, tuple[int, ...]]:
+    """Return the sheet rows, the header row index and the resolved columns."""
 
-            player = _stringify(raw_row[mapping["player"]])
-            if not player:
-                continue
+    rows = _load_excel_rows(document)
+    if not rows:
+        raise ValueError("The Excel sheet does not contain any data.")
+    header_index, columns = _locate_header(rows)
+    return rows, header_index, columns
 
-            team = _stringify(raw_row[mapping["team"]]) or None
-            group = _stringify(raw_row[mapping["group"]]) or None
-            matches = _parse_int_cell(raw_row[mapping["matches"]])
-            goals_total, penalty_goals, goals_details = _parse_goals_cell(
-                raw_row[mapping["goals"]]
-            )
-            ratio = _parse_ratio_cell(raw_row[mapping["ratio"]])
-            if ratio is None and matches and goals_total is not None and matches != 0:
-                ratio = goals_total / matches
-
-            raw_lines = [
-                value
-                for value in (
-                    _stringify(raw_row[mapping["player"]]),
-                    _stringify(raw_row[mapping["team"]]),
-                    _stringify(raw_row[mapping["group"]]),
-                    _stringify(raw_row[mapping["matches"]]),
-                    _stringify(raw_row[mapping["goals"]]),
-                    _stringify(raw_row[mapping["ratio"]]),
-                )
-                if value
-            ]
-
-            scorers.append(
-                TopScorerEntry(
-                    player=player,
-                    team=team,
-                    group=group or category,
-                    matches_played=matches,
-                    goals_total=goals_total,
-                    goals_details=goals_details,
-                    penalty_goals=penalty_goals,
-                    goals_per_match=ratio,
-                    raw_lines=raw_lines,
-                )
+
+def _iter_entries(
+    rows: List[List[Any]],
+    header_index: int,
+    columns: tuple[int, ...],
+    category: Optional[str],
+) -> Iterator[TopScorerEntry]:
+    """Yield scorer entries for the data rows below ``header_index`` in sheet order."""
+
+    player_col, team_col, group_col, matches_col, goals_col, ratio_col = columns
+    # Team, group and category labels repeat on every row of a sheet, so
+    # each distinct short value is interned and shared by all entries.
+    if category:
+        category = _intern_label(category)
+
+    for raw_row in islice(rows, header_index + 1, None):
+        if _row_is_empty(raw_row):
+            continue
+
+        player = _stringify(raw_row[player_col])
+        if not player:
+            continue
+
+        team = _stringify(raw_row[team_col])
+        group = _stringify(raw_row[group_col])
+        matches = _parse_int_cell(raw_row[matches_col])
+        goals_total, penalty_goals, goals_details = _parse_goals_cell(raw_row[goals_col])
+        ratio = _parse_ratio_cell(raw_row[ratio_col])
+        if ratio is None and matches and goals_total is not None and matches != 0:
+            ratio = goals_total / matches
+
+        raw_lines = [
+            value
+            for value in (
+                player,
+                team,
+                group,
+                _stringify(raw_row[matches_col]),
+                _stringify(raw_row[goals_col]),
+                _stringify(raw_row[ratio_col]),
             )
+            if value
+        ]
+
+        yield TopScorerEntry(
+            player=player,
+            team=_intern_label(team) if team else None,
+            group=_intern_label(group) if group else category,
+            matches_played=matches,
+            goals_total=goals_total,
+            goals_details=goals_details,
+            penalty_goals=penalty_goals,
+            goals_per_match=ratio,
+            raw_lines=raw_lines,
+        )
+
+
+class TopScorersExcelParser:
+    """Decode top scorers information from uploaded Excel spreadsheets."""
+
+    def parse(self, document: bytes | BinaryIO) -> TopScorersTable:
+        """Parse ``document`` bytes or binary stream into a :class:`TopScorersTable`."""
 
+        rows, header_index, columns = _load_scorer_sheet(document)
+        title, competition, category, season = _extract_metadata(rows[:header_index])
+
+        scorers = list(_iter_entries(rows, header_index, columns, category))
         if not scorers:
             raise ValueError("No scorer entries were found in the provided Excel file.")
 
-        indexed = list(enumerate(scorers))
-        indexed.sort(key=lambda item: (-(item[1].goals_total or -1), item[0]))
-        ordered = [entry for _, entry in indexed]
+        # ``list.sort`` is stable, so ties keep their sheet order.
+        scorers.sort(key=lambda entry: -(entry.goals_total or -1))
 
         return TopScorersTable(
             title=title,
             competition=competition,
             category=category,
             season=season,
-            scorers=ordered,
+            scorers=scorers,
         )
+
+    def iter_scorers(
+        self, document: bytes | BinaryIO, chunk_size: int = 1000
+    ) -> Iterator[List[TopScorerEntry]]:
+        """Return an iterator over sheet-ordered lists of at most ``chunk_size`` entries.
+
+        Unlike :meth:`parse`, entries are not ranked by goals and are built
+        batch by batch, although every sheet row is still loaded up front.
+        ``chunk_size`` and the document are validated before returning.
+        """
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+
+        rows, header_index, columns = _load_scorer_sheet(document)
+        _, _, category, _ = _extract_metadata(rows[:header_index])
+        entries = _iter_entries(rows, header_index, columns, category)
+
+        def _chunks() -> Iterator[List[TopScorerEntry]]:
+            while chunk := list(islice(entries, chunk_size)):
+                yield chunk
+
+        return _chunks()
@@ -9,28 +9,52 @@ from app.domain.repositories.top_scorer_repository import TopScorersRepository
 
 
 class JsonTopScorersRepository(TopScorersRepository):
-    """Persist top scorers tables using a JSON file on disk."""
+    """Persist top scorers tables using a JSON file on disk.
+
+    The last loaded table is kept in memory together with the file's
+    modification stamp, so repeated reads skip JSON decoding until the file
+    changes on disk.
+    """
 
     def __init__(self, file_path: Path) -> None:
         """Initialize the repository with the destination file path."""
 
         self._file_path = file_path
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cached_table: TopScorersTable | None = None
+        self._cached_stamp: tuple[int, int] | None = None
 
     def save(self, table: TopScorersTable) -> None:
         """Serialize and persist the provided top scorers table."""
 
         with self._file_path.open("w", encoding="utf-8") as output_file:
             json.dump(table.to_dict(), output_file, ensure_ascii=False, indent=2)
+        # The next load decodes the file, so callers get what was persisted.
+        self._cached_table = None
+        self._cached_stamp = None
 
     def load(self) -> TopScorersTable | None:
         """Return the stored top scorers table when available."""
 
-        if not self._file_path.exists():
+        stamp = self._file_stamp()
+        if stamp is None:
             return None
+        if stamp == self._cached_stamp:
+            return self._cached_table
 
         with self._file_path.open("r", encoding="utf-8") as input_file:
             payload = json.load(input_file)
 
-        return TopScorersTable.from_dict(payload)
+        table = TopScorersTable.from_dict(payload)
+        self._cached_table = table
+        self._cached_stamp = stamp
+        return table
+
+    def _file_stamp(self) -> tuple[int, int] | None:
+        """Return the modification time and size of the backing file if it exists."""
 
+        try:
+            stat = self._file_path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
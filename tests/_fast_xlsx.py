@@ -0,0 +1,111 @@
+"""Minimal XLSX writer used to build spreadsheet fixtures without openpyxl."""
+from __future__ import annotations
+
+from io import BytesIO
+from typing import Iterable
+from xml.sax.saxutils import escape
+from zipfile import ZIP_STORED, ZipFile
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    "</Types>"
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+    "</workbook>"
+)
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    "</Relationships>"
+)
+
+# The package parts that never change are encoded once and shared by every
+# workbook built during the session; only the worksheet is rendered per call.
+_STATIC_PARTS = tuple(
+    (name, xml.encode("utf-8"))
+    for name, xml in (
+        ("[Content_Types].xml", _CONTENT_TYPES),
+        ("_rels/.rels", _ROOT_RELS),
+        ("xl/workbook.xml", _WORKBOOK),
+        ("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS),
+    )
+)
+
+
+def _column_letter(index: int) -> str:
+    """Return the spreadsheet column letter for the zero-based ``index``."""
+
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _cell_xml(reference: str, value: object) -> str:
+    """Return the XML for a single cell holding ``value``."""
+
+    if isinstance(value, bool):
+        return f'<c r="{reference}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{reference}"><v>{value}</v></c>'
+    return f'<c r="{reference}" t="inlineStr"><is><t>{escape(str(value))}</t></is></c>'
+
+
+def _sheet_xml(rows: Iterable[Iterable[object]]) -> str:
+    """Return the worksheet XML for ``rows`` skipping ``None`` cells."""
+
+    row_parts = []
+    max_columns = 1
+    row_index = 0
+    for row_index, row in enumerate(rows, start=1):
+        values = list(row)
+        max_columns = max(max_columns, len(values))
+        cells = "".join(
+            _cell_xml(f"{_column_letter(col_index)}{row_index}", value)
+            for col_index, value in enumerate(values)
+            if value is not None
+        )
+        row_parts.append(f'<row r="{row_index}">{cells}</row>')
+    dimension = f"A1:{_column_letter(max_columns - 1)}{max(row_index, 1)}"
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        f'<dimension ref="{dimension}"/>'
+        f"<sheetData>{''.join(row_parts)}</sheetData>"
+        "</worksheet>"
+    )
+
+
+def build_xlsx(rows: Iterable[Iterable[object]]) -> bytes:
+    """Return the bytes of a single-sheet XLSX workbook containing ``rows``."""
+
+    buffer = BytesIO()
+    with ZipFile(buffer, "w", ZIP_STORED) as archive:
+        for name, data in _STATIC_PARTS:
+            archive.writestr(name, data)
+        archive.writestr("xl/worksheets/sheet1.xml", _sheet_xml(rows))
+    return buffer.getvalue()
@@ -2,7 +2,13 @@
 from __future__ import annotations
 
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 
 def _ensure_src_on_path() -> None:
@@ -16,3 +22,214 @@ def _ensure_src_on_path() -> None:
 
 
 _ensure_src_on_path()
+
+from app.application.process_document import DocumentParser  # noqa: E402
+from app.application.process_matchday import MatchdayParser  # noqa: E402
+from app.domain.models.document import ParsedDocument  # noqa: E402
+from app.domain.models.matchday import Matchday  # noqa: E402
+from app.domain.repositories.matchday_repository import MatchdayRepository  # noqa: E402
+
+
+@dataclass(frozen=True, slots=True)
+class StubDocumentParser:
+    """Stub document parser returning a prepared ``ParsedDocument``."""
+
+    document: ParsedDocument
+
+    def parse(self, document_bytes: bytes) -> ParsedDocument:  # noqa: D401 - protocol compliance
+        """Return the stored document regardless of the provided bytes."""
+
+        return self.document
+
+
+class StubMatchdayParser(MatchdayParser):
+    """Stub parser returning a predefined matchday."""
+
+    def __init__(self, matchday: Matchday) -> None:
+        self.matchday = matchday
+        self.received_bytes: bytes | None = None
+
+    def parse(self, document_bytes: bytes) -> Matchday:  # noqa: D401 - protocol compliance
+        """Return the stored matchday while remembering the input bytes."""
+
+        self.received_bytes = document_bytes
+        return self.matchday
+
+
+class InMemoryMatchdayRepository(MatchdayRepository):
+    """In-memory repository used to test the HTTP layer."""
+
+    def __init__(self) -> None:
+        self._data: Dict[int, Matchday] = {}
+        self._highest: int | None = None
+
+    def save(self, matchday: Matchday) -> None:  # noqa: D401 - protocol compliance
+        """Store the given matchday in memory."""
+
+        self._data[matchday.number] = matchday
+        if self._highest is None or matchday.number > self._highest:
+            self._highest = matchday.number
+
+    def get(self, number: int) -> Matchday | None:  # noqa: D401 - protocol compliance
+        """Return the stored matchday for ``number`` if present."""
+
+        return self._data.get(number)
+
+    def get_last(self) -> Matchday | None:  # noqa: D401 - protocol compliance
+        """Return the matchday with the highest key in memory."""
+
+        if self._highest is None:
+            return None
+        return self._data[self._highest]
+
+    def delete(self, number: int) -> bool:  # noqa: D401 - protocol compliance
+        """Remove the matchday identified by ``number`` when present."""
+
+        if self._data.pop(number, None) is None:
+            return False
+        if number == self._highest:
+            self._highest = max(self._data, default=None)
+        return True
+
+    def delete_last(self) -> bool:  # noqa: D401 - protocol compliance
+        """Remove the matchday with the highest key when present."""
+
+        if self._highest is None:
+            return False
+        return self.delete(self._highest)
+
+    def clear(self) -> None:
+        """Remove every stored matchday."""
+
+        self._data.clear()
+        self._highest = None
+
+
+@pytest.fixture(scope="session")
+def stub_document_parser() -> Callable[[ParsedDocument], DocumentParser]:
+    """Return a factory wrapping a ``ParsedDocument`` in a stub document parser."""
+
+    return StubDocumentParser
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run ``anyio``-marked tests on the asyncio event loop only."""
+
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def matchday_parser() -> StubMatchdayParser:
+    """Return the stub matchday parser wired into the shared app."""
+
+    return StubMatchdayParser(Matchday(1, []))
+
+
+@pytest.fixture(scope="session")
+def matchday_repository() -> InMemoryMatchdayRepository:
+    """Return the league matchday repository wired into the shared app."""
+
+    return InMemoryMatchdayRepository()
+
+
+@pytest.fixture(scope="session")
+def cup_matchday_repository() -> InMemoryMatchdayRepository:
+    """Return the cup matchday repository wired into the shared app."""
+
+    return InMemoryMatchdayRepository()
+
+
+@pytest.fixture(scope="session")
+def storage_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return the session directory backing the JSON repositories of the shared app."""
+
+    return tmp_path_factory.mktemp("storage")
+
+
+@pytest.fixture(scope="session")
+def app(
+    storage_dir: Path,
+    matchday_parser: StubMatchdayParser,
+    matchday_repository: InMemoryMatchdayRepository,
+    cup_matchday_repository: InMemoryMatchdayRepository,
+) -> FastAPI:
+    """Build the FastAPI application once for the whole test session.
+
+    Matchday storage is replaced by in-memory doubles; every other JSON
+    repository is rooted in ``storage_dir`` and the API key guard is disabled.
+    ``app.main`` is imported here rather than at module level because it
+    builds a default app on import; deferring it keeps that app inside the
+    per-worker ``storage_dir`` when the suite runs under ``pytest -n auto``.
+    """
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("UPLOAD_DIR", str(storage_dir))
+        monkeypatch.delenv("BACK_API_KEY", raising=False)
+        from app.main import create_app
+
+        return create_app(
+            matchday_parser=matchday_parser,
+            matchday_repo=matchday_repository,
+            matchday_cup_repo=cup_matchday_repository,
+        )
+
+
+@pytest.fixture(scope="session")
+def client(app: FastAPI) -> Iterator[TestClient]:
+    """Return a client bound to the shared application.
+
+    The client is entered as a context manager so the app lifespan runs once
+    for the whole session and requests reuse the same transport.
+    """
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def _reset_matchday_doubles(
+    matchday_parser: StubMatchdayParser,
+    matchday_repository: InMemoryMatchdayRepository,
+    cup_matchday_repository: InMemoryMatchdayRepository,
+) -> None:
+    """Restore the shared matchday test doubles before each test."""
+
+    matchday_parser.matchday = Matchday(1, [])
+    matchday_parser.received_bytes = None
+    matchday_repository.clear()
+    cup_matchday_repository.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_storage(storage_dir: Path) -> None:
+    """Remove the files persisted by the shared app before each test."""
+
+    for stored_path in storage_dir.rglob("*"):
+        if stored_path.is_file():
+            stored_path.unlink()
+
+
+@pytest.fixture(autouse=True)
+def _forbid_openpyxl(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Fail ``negative``-marked tests that load a workbook with openpyxl.
+
+    Spreadsheet error-path tests are expected to be rejected before openpyxl
+    opens a workbook; this keeps them on the fast path as the suite grows.
+    """
+
+    if request.node.get_closest_marker("negative") is None:
+        yield
+        return
+
+    import openpyxl
+
+    from app.infrastructure.parsers import top_scorers_excel_parser
+
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        pytest.fail("openpyxl used in a negative test")
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(openpyxl, "load_workbook", _fail)
+        monkeypatch.setattr(top_scorers_excel_parser, "load_workbook", _fail)
+        yield
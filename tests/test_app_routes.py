@@ -3,14 +3,10 @@ from __future__ import annotations
 
 from fastapi.testclient import TestClient
 
-from app.main import create_app
 
-
-def test_root_endpoint_returns_running_message() -> None:
+def test_root_endpoint_returns_running_message(client: TestClient) -> None:
     """The root endpoint should return the expected heartbeat payload."""
 
-    client = TestClient(create_app())
-
     response = client.get("/")
 
     assert response.status_code == 200
@@ -12,7 +12,8 @@ from app.infrastructure.repositories.json_top_scorers_repository import (
 def test_json_top_scorers_repository_roundtrip(tmp_path: Path) -> None:
     """Saving and loading a top scorers table should preserve its data."""
 
-    repository = JsonTopScorersRepository(tmp_path / "top_scorers.json")
+    file_path = tmp_path / "top_scorers.json"
+    repository = JsonTopScorersRepository(file_path)
     table = TopScorersTable(
         title="Liga Example",
         competition="Liga Example",
@@ -29,12 +30,44 @@ def test_json_top_scorers_repository_roundtrip(tmp_path: Path) -> None:
                 penalty_goals=None,
                 goals_per_match=1.67,
                 raw_lines=["PLAYER, ONE TEAM Grupo 3 5 1,6700"],
-            )
+            ),
+            TopScorerEntry(
+                player="PLAYER TWO",
+                team=None,
+                group=None,
+                matches_played=None,
+                goals_total=2,
+                goals_details=None,
+                penalty_goals=0,
+                goals_per_match=None,
+                raw_lines=[],
+            ),
         ],
     )
 
     repository.save(table)
-    loaded = repository.load()
+    saved_loaded = repository.load()
+    fresh_loaded = JsonTopScorersRepository(file_path).load()
+
+    assert saved_loaded == table
+    assert saved_loaded is not table
+    assert fresh_loaded == table
+
+
+def test_json_top_scorers_repository_reloads_external_changes(tmp_path: Path) -> None:
+    """Loading should reflect writes made to the file by another repository instance."""
+
+    file_path = tmp_path / "top_scorers.json"
+    repository = JsonTopScorersRepository(file_path)
+    repository.save(TopScorersTable(title="First"))
+    assert repository.load() == TopScorersTable(title="First")
+
+    JsonTopScorersRepository(file_path).save(
+        TopScorersTable(title="Second", season="2025-2026")
+    )
+
+    assert repository.load() == TopScorersTable(title="Second", season="2025-2026")
 
-    assert loaded == table
+    file_path.unlink()
 
+    assert repository.load() is None
@@ -1,56 +1,159 @@
 """Tests for the matchday PDF parser heuristics."""
 from __future__ import annotations
 
+from typing import Callable
+
+import pytest
+
+from app.application.process_document import DocumentParser
 from app.domain.models.document import DocumentPage, ParsedDocument
+from app.domain.models.matchday import Matchday
 from app.infrastructure.parsers.matchday_pdf_parser import MatchdayPdfParser
 
+pytestmark = pytest.mark.slow
+
+
+_NO_SCORES_PAGE = DocumentPage(
+    number=1,
+    content=(
+        "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+        "Jornada 1",
+        "Resultados",
+        "Descansa AMERICA",
+        "REAL SPORT 11-10-2025",
+        "15:30",
+        "REAL TAJO",
+        "Campo: ENRIQUE MORENO - B - Hierba Artificial",
+        "RACING ARANJUEZ 11-10-2025",
+        "20:00",
+        "ALBIRROJA",
+        "Campo: ENRIQUE MORENO - B - Hierba Artificial",
+        "LA VESPA TAPAS-CLUB",
+        "ATLETICO DE ARANJUEZ 12-10-2025",
+        "09:00",
+        "AMG-ASESORIA JURIDICAEXCAVACIONES",
+        "TAJO",
+        "Campo: ENRIQUE MORENO - B - Hierba Artificial",
+        "IRT ARANJUEZ 12-10-2025",
+        "09:00",
+        "CELTIC C.F.",
+        "Campo: ENRIQUE MORENO - F - Hierba Artificial",
+    ),
+)
+
+
+_SCORES_PAGE = DocumentPage(
+    number=1,
+    content=(
+        "LIGA AFICIONADOS F-11, 2ª AFICIONADOS F-11 Temporada 2025-2026",
+        "Jornada 3",
+        "Resultados",
+        "C.D. VETERANOS PANTOJA 0 - 1 RAIMON",
+        "Descansa UNION CAFETERA",
+        "NEW COTTON MEKASO MCS",
+        "05-10-2025",
+        "10:30",
+        "CAFETERIA LA TACITA",
+        "Campo: ENRIQUE MORENO - B - Hierba Artificial",
+        "SHOTS FC",
+        "3 - 2",
+        "05-10-2025",
+        "10:30",
+        "FC. RAYO ARANJUEZ",
+        "Campo: ENRIQUE MORENO - F - Hierba Artificial",
+        "TABERNA CASARES / MISTER",
+        "PIXEL",
+        "0 - 0",
+        "Campo: ENRIQUE MORENO - C - Hierba Artificial",
+        "GOLDEN F.C.",
+        "05-10-2025",
+        "12:00",
+        "ATLETICO PERU",
+        "Campo: ENRIQUE MORENO - D - Hierba Artificial",
+        "CHESTERFIELD UNITED",
+        "ALPHA TEAM",
+        "0 - 0",
+        "Campo: ENRIQUE MORENO - E - Hierba Artificial",
+    ),
+)
+
+
+_EMBEDDED_SCORE_PAGE = DocumentPage(
+    number=1,
+    content=(
+        "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+        "Jornada 1",
+        "Resultados",
+        "Descansa AMERICA",
+        "REAL SPORT 2 - 1",
+        "11-10-2025",
+        "15:30",
+        "REAL TAJO",
+        "Campo: ENRIQUE MORENO - B - Hierba Artificial",
+    ),
+)
 
-class _StubDocumentParser:
-    """Stub document parser returning a prepared ``ParsedDocument``."""
 
-    def __init__(self, document: ParsedDocument) -> None:
-        self._document = document
+_DESCANSA_SUFFIX_PAGE = DocumentPage(
+    number=1,
+    content=(
+        "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+        "Jornada 2",
+        "Resultados",
+        "AMG-ASESORIA JURIDICA",
+        "EXCAVACIONES",
+        "TAJO Descansa",
+        "REAL TAJO",
+        "3 - 0",
+        "19-10-2025",
+        "13:40",
+        "IRT ARANJUEZ",
+        "Campo: ENRIQUE MORENO - F - Hierba Artificial",
+    ),
+)
 
-    def parse(self, document_bytes: bytes) -> ParsedDocument:  # noqa: D401 - protocol compliance
-        """Return the stored document regardless of the provided bytes."""
 
-        return self._document
+_MISSING_NUMBER_PAGE = DocumentPage(
+    number=1,
+    content=(
+        "Resultados",
+        "TEAM A",
+        "TEAM B",
+        "1 - 0",
+    ),
+)
 
 
-def test_parser_extracts_matchday_without_scores() -> None:
+_BYE_AFTER_FIXTURE_PAGE = DocumentPage(
+    number=1,
+    content=(
+        "Jornada 12",
+        "Resultados",
+        "TEAM A",
+        "TEAM B",
+        "1 - 0",
+        "TEAM X Descansa",
+    ),
+)
+
+
+def _parse_page(
+    page: DocumentPage,
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> Matchday:
+    """Run the matchday parser over a document made of the single ``page``."""
+
+    document = ParsedDocument(pages=(page,))
+    parser = MatchdayPdfParser(document_parser=stub_document_parser(document))
+    return parser.parse(b"dummy")
+
+
+def test_parser_extracts_matchday_without_scores(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Parser should extract fixtures even when no scores are present."""
 
-    page = DocumentPage(
-        number=1,
-        content=[
-            "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
-            "Jornada 1",
-            "Resultados",
-            "Descansa AMERICA",
-            "REAL SPORT 11-10-2025",
-            "15:30",
-            "REAL TAJO",
-            "Campo: ENRIQUE MORENO - B - Hierba Artificial",
-            "RACING ARANJUEZ 11-10-2025",
-            "20:00",
-            "ALBIRROJA",
-            "Campo: ENRIQUE MORENO - B - Hierba Artificial",
-            "LA VESPA TAPAS-CLUB",
-            "ATLETICO DE ARANJUEZ 12-10-2025",
-            "09:00",
-            "AMG-ASESORIA JURIDICAEXCAVACIONES",
-            "TAJO",
-            "Campo: ENRIQUE MORENO - B - Hierba Artificial",
-            "IRT ARANJUEZ 12-10-2025",
-            "09:00",
-            "CELTIC C.F.",
-            "Campo: ENRIQUE MORENO - F - Hierba Artificial",
-        ],
-    )
-    document = ParsedDocument(pages=[page])
-    parser = MatchdayPdfParser(document_parser=_StubDocumentParser(document))
-
-    matchday = parser.parse(b"dummy")
+    matchday = _parse_page(_NO_SCORES_PAGE, stub_document_parser)
 
     assert matchday.number == 1
     assert [fixture.is_bye for fixture in matchday.fixtures] == [True, False, False, False, False]
@@ -70,47 +173,12 @@ def test_parser_extracts_matchday_without_scores() -> None:
     assert all(fixture.home_score is None for fixture in matchday.fixtures if not fixture.is_bye)
 
 
-def test_parser_extracts_scores_and_results() -> None:
+def test_parser_extracts_scores_and_results(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Parser should extract scores when present in the PDF content."""
 
-    page = DocumentPage(
-        number=1,
-        content=[
-            "LIGA AFICIONADOS F-11, 2ª AFICIONADOS F-11 Temporada 2025-2026",
-            "Jornada 3",
-            "Resultados",
-            "C.D. VETERANOS PANTOJA 0 - 1 RAIMON",
-            "Descansa UNION CAFETERA",
-            "NEW COTTON MEKASO MCS",
-            "05-10-2025",
-            "10:30",
-            "CAFETERIA LA TACITA",
-            "Campo: ENRIQUE MORENO - B - Hierba Artificial",
-            "SHOTS FC",
-            "3 - 2",
-            "05-10-2025",
-            "10:30",
-            "FC. RAYO ARANJUEZ",
-            "Campo: ENRIQUE MORENO - F - Hierba Artificial",
-            "TABERNA CASARES / MISTER",
-            "PIXEL",
-            "0 - 0",
-            "Campo: ENRIQUE MORENO - C - Hierba Artificial",
-            "GOLDEN F.C.",
-            "05-10-2025",
-            "12:00",
-            "ATLETICO PERU",
-            "Campo: ENRIQUE MORENO - D - Hierba Artificial",
-            "CHESTERFIELD UNITED",
-            "ALPHA TEAM",
-            "0 - 0",
-            "Campo: ENRIQUE MORENO - E - Hierba Artificial",
-        ],
-    )
-    document = ParsedDocument(pages=[page])
-    parser = MatchdayPdfParser(document_parser=_StubDocumentParser(document))
-
-    matchday = parser.parse(b"dummy")
+    matchday = _parse_page(_SCORES_PAGE, stub_document_parser)
 
     assert matchday.number == 3
     fixtures = [fixture for fixture in matchday.fixtures if not fixture.is_bye]
@@ -138,27 +206,12 @@ def test_parser_extracts_scores_and_results() -> None:
     assert fixtures[5].home_score == 0 and fixtures[5].away_score == 0
 
 
-def test_parser_extracts_score_embedded_in_home_team_line() -> None:
+def test_parser_extracts_score_embedded_in_home_team_line(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Parser should capture scores appended to a team line."""
 
-    page = DocumentPage(
-        number=1,
-        content=[
-            "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
-            "Jornada 1",
-            "Resultados",
-            "Descansa AMERICA",
-            "REAL SPORT 2 - 1",
-            "11-10-2025",
-            "15:30",
-            "REAL TAJO",
-            "Campo: ENRIQUE MORENO - B - Hierba Artificial",
-        ],
-    )
-    document = ParsedDocument(pages=[page])
-    parser = MatchdayPdfParser(document_parser=_StubDocumentParser(document))
-
-    matchday = parser.parse(b"dummy")
+    matchday = _parse_page(_EMBEDDED_SCORE_PAGE, stub_document_parser)
 
     fixtures = [fixture for fixture in matchday.fixtures if not fixture.is_bye]
     assert fixtures[0].home_team == "REAL SPORT"
@@ -169,30 +222,12 @@ def test_parser_extracts_score_embedded_in_home_team_line() -> None:
     assert fixtures[0].time == "15:30"
 
 
-def test_parser_handles_descansa_suffix_and_post_score_away_team() -> None:
+def test_parser_handles_descansa_suffix_and_post_score_away_team(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Parser should detect byes and away teams declared after the score line."""
 
-    page = DocumentPage(
-        number=1,
-        content=[
-            "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
-            "Jornada 2",
-            "Resultados",
-            "AMG-ASESORIA JURIDICA",
-            "EXCAVACIONES",
-            "TAJO Descansa",
-            "REAL TAJO",
-            "3 - 0",
-            "19-10-2025",
-            "13:40",
-            "IRT ARANJUEZ",
-            "Campo: ENRIQUE MORENO - F - Hierba Artificial",
-        ],
-    )
-    document = ParsedDocument(pages=[page])
-    parser = MatchdayPdfParser(document_parser=_StubDocumentParser(document))
-
-    matchday = parser.parse(b"dummy")
+    matchday = _parse_page(_DESCANSA_SUFFIX_PAGE, stub_document_parser)
 
     assert matchday.number == 2
     assert len(matchday.fixtures) == 2
@@ -209,24 +244,12 @@ def test_parser_handles_descansa_suffix_and_post_score_away_team() -> None:
     assert match_fixture.time == "13:40"
 
 
-def test_parser_finalizes_fixture_before_bye_block() -> None:
+def test_parser_finalizes_fixture_before_bye_block(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Parser should not drop the previous fixture when a bye follows immediately."""
 
-    page = DocumentPage(
-        number=1,
-        content=[
-            "Jornada 12",
-            "Resultados",
-            "TEAM A",
-            "TEAM B",
-            "1 - 0",
-            "TEAM X Descansa",
-        ],
-    )
-    document = ParsedDocument(pages=[page])
-    parser = MatchdayPdfParser(document_parser=_StubDocumentParser(document))
-
-    matchday = parser.parse(b"dummy")
+    matchday = _parse_page(_BYE_AFTER_FIXTURE_PAGE, stub_document_parser)
 
     assert len(matchday.fixtures) == 2
     first_fixture, bye_fixture = matchday.fixtures
@@ -237,3 +260,12 @@ def test_parser_finalizes_fixture_before_bye_block() -> None:
     assert first_fixture.away_score == 0
     assert bye_fixture.is_bye
     assert bye_fixture.home_team == "TEAM X"
+
+
+def test_parser_handles_missing_matchday_number(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
+    """Parser should reject documents that never state the matchday number."""
+
+    with pytest.raises(ValueError, match="matchday number could not be determined"):
+        _parse_page(_MISSING_NUMBER_PAGE, stub_document_parser)
@@ -5,6 +5,8 @@ from datetime import date
 
 from app.domain.models.real_tajo_calendar import RealTajoMatch
 
+_EXPECTED_DATE = date(2025, 10, 18)
+
 
 def test_real_tajo_match_from_dict_accepts_missing_date() -> None:
     """Matches without an assigned date should keep the value unset."""
@@ -40,5 +42,21 @@ def test_real_tajo_match_from_dict_parses_valid_date() -> None:
         }
     )
 
-    assert match.match_date == date(2025, 10, 18)
-    assert match.to_dict()["date"] == "2025-10-18"
+    assert match.match_date == _EXPECTED_DATE
+    assert match.to_dict()["date"] == _EXPECTED_DATE.isoformat()
+
+
+def test_real_tajo_match_from_dict_ignores_invalid_date() -> None:
+    """Unparseable date strings should leave the match without a date."""
+
+    match = RealTajoMatch.from_dict({"matchday": 7, "date": "2025-13-40"})
+
+    assert match.match_date is None
+
+
+def test_real_tajo_match_from_dict_rejects_basic_format_date() -> None:
+    """Compact ``YYYYMMDD`` dates are not accepted on any Python version."""
+
+    match = RealTajoMatch.from_dict({"matchday": 7, "date": "20251018"})
+
+    assert match.match_date is None
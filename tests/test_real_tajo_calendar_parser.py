@@ -1,24 +1,25 @@
 """Tests for the Real Tajo calendar PDF parser."""
 from __future__ import annotations
 
+import sys
 from datetime import date
+from typing import Callable
 
+from app.application.process_document import DocumentParser
 from app.domain.models.document import DocumentPage, ParsedDocument
 from app.infrastructure.parsers.real_tajo_calendar_parser import (
     RealTajoCalendarPdfParser,
 )
 
-
-class _StubDocumentParser:
-    """Stub parser returning a pre-defined ``ParsedDocument`` for testing."""
-
-    def __init__(self, document: ParsedDocument) -> None:
-        self._document = document
-
-    def parse(self, document_bytes: bytes) -> ParsedDocument:  # noqa: D401 - protocol compliance
-        """Return the stored document regardless of input."""
-
-        return self._document
+# Team names wrapped across PDF lines repeat throughout the fixtures; share
+# one interned object per string instead of a separate literal per test.
+_AMG = sys.intern("AMG-ASESORIA JURIDICA- EXCAVACIONES")
+_VESPA = sys.intern("LA VESPA TAPAS-CLUB ATLETICO DE")
+_ARANJUEZ = sys.intern("ARANJUEZ")
+_TAJO = sys.intern("TAJO")
+_COMPETITION_HEADER = sys.intern(
+    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026"
+)
 
 
 def _build_sample_document() -> ParsedDocument:
@@ -26,9 +27,9 @@ def _build_sample_document() -> ParsedDocument:
 
     page_one = DocumentPage(
         number=1,
-        content=[
+        content=(
             "Calendario de Competiciones",
-            "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+            _COMPETITION_HEADER,
             "Equipos Participantes",
             "AFICIONADOS F-11",
             "1.- NUEVO (1054)",
@@ -42,84 +43,84 @@ def _build_sample_document() -> ParsedDocument:
             "9.- IRT ARANJUEZ (1049)",
             "10.- ALBIRROJA (1050)",
             "DELEGACION ZONAL DE ARANJUEZ R.F.F.M.",
-        ],
+        ),
     )
 
     page_two = DocumentPage(
         number=2,
-        content=[
+        content=(
             "Calendario de Competiciones",
-            "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+            _COMPETITION_HEADER,
             "Primera Vuelta",
             "Jornada 1 (11-10-2025)",
             "NUEVO - AMERICA",
             "REAL TAJO - RACING ARANJUEZ",
             "CELTIC C.F. - REAL SPORT",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - IRT ARANJUEZ",
             "ALBIRROJA - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "Jornada 2 (18-10-2025)",
             "AMERICA - ALBIRROJA",
             "RACING ARANJUEZ - NUEVO",
             "REAL SPORT - REAL TAJO",
             "IRT ARANJUEZ - CELTIC C.F.",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "Jornada 3 (25-10-2025)",
             "AMERICA - RACING ARANJUEZ",
             "NUEVO - REAL SPORT",
             "REAL TAJO - IRT ARANJUEZ",
             "CELTIC C.F. - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "ALBIRROJA - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "Jornada 4 (08-11-2025)",
             "RACING ARANJUEZ - ALBIRROJA",
             "REAL SPORT - AMERICA",
             "IRT ARANJUEZ - NUEVO",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - REAL TAJO",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - CELTIC C.F.",
             "Jornada 5 (15-11-2025)",
             "RACING ARANJUEZ - REAL SPORT",
             "AMERICA - IRT ARANJUEZ",
             "NUEVO - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "REAL TAJO - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "ALBIRROJA - CELTIC C.F.",
             "Jornada 6 (29-11-2025)",
             "REAL SPORT - ALBIRROJA",
             "IRT ARANJUEZ - RACING ARANJUEZ",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - AMERICA",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - NUEVO",
             "CELTIC C.F. - REAL TAJO",
             "Jornada 7 (13-12-2025)",
             "REAL SPORT - IRT ARANJUEZ",
             "RACING ARANJUEZ - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "AMERICA - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "NUEVO - CELTIC C.F.",
             "ALBIRROJA - REAL TAJO",
             "Jornada 8 (10-01-2026)",
             "ALBIRROJA - IRT ARANJUEZ",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - REAL SPORT",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - RACING ARANJUEZ",
             "CELTIC C.F. - AMERICA",
             "REAL TAJO - NUEVO",
             "Jornada 9 (24-01-2026)",
             "IRT ARANJUEZ - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "REAL SPORT - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "RACING ARANJUEZ - CELTIC C.F.",
             "AMERICA - REAL TAJO",
             "NUEVO - ALBIRROJA",
@@ -129,79 +130,79 @@ def _build_sample_document() -> ParsedDocument:
             "RACING ARANJUEZ - REAL TAJO",
             "REAL SPORT - CELTIC C.F.",
             "IRT ARANJUEZ - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _TAJO,
+            _VESPA,
             "ARANJUEZ - ALBIRROJA",
             "Jornada 11 (14-02-2026)",
             "ALBIRROJA - AMERICA",
             "NUEVO - RACING ARANJUEZ",
             "REAL TAJO - REAL SPORT",
             "CELTIC C.F. - IRT ARANJUEZ",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "Jornada 12 (21-02-2026)",
             "RACING ARANJUEZ - AMERICA",
             "REAL SPORT - NUEVO",
             "IRT ARANJUEZ - REAL TAJO",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - CELTIC C.F.",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - ALBIRROJA",
             "Jornada 13 (14-03-2026)",
             "ALBIRROJA - RACING ARANJUEZ",
             "AMERICA - REAL SPORT",
             "NUEVO - IRT ARANJUEZ",
             "REAL TAJO - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "CELTIC C.F. - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "Jornada 14 (21-03-2026)",
             "REAL SPORT - RACING ARANJUEZ",
             "IRT ARANJUEZ - AMERICA",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - NUEVO",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - REAL TAJO",
             "CELTIC C.F. - ALBIRROJA",
             "Jornada 15 (11-04-2026)",
             "ALBIRROJA - REAL SPORT",
             "RACING ARANJUEZ - IRT ARANJUEZ",
             "AMERICA - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "NUEVO - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "REAL TAJO - CELTIC C.F.",
             "Jornada 16 (18-04-2026)",
             "IRT ARANJUEZ - REAL SPORT",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - RACING ARANJUEZ",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - AMERICA",
             "CELTIC C.F. - NUEVO",
             "REAL TAJO - ALBIRROJA",
             "Jornada 17 (09-05-2026)",
             "IRT ARANJUEZ - ALBIRROJA",
             "REAL SPORT - LA VESPA TAPAS-CLUB ATLETICO DE",
-            "ARANJUEZ",
+            _ARANJUEZ,
             "RACING ARANJUEZ - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-            "TAJO",
+            _TAJO,
             "AMERICA - CELTIC C.F.",
             "NUEVO - REAL TAJO",
             "Jornada 18 (16-05-2026)",
-            "LA VESPA TAPAS-CLUB ATLETICO DE",
+            _VESPA,
             "ARANJUEZ - IRT ARANJUEZ",
-            "AMG-ASESORIA JURIDICA- EXCAVACIONES",
+            _AMG,
             "TAJO - REAL SPORT",
             "CELTIC C.F. - RACING ARANJUEZ",
             "REAL TAJO - AMERICA",
             "ALBIRROJA - NUEVO",
-        ],
+        ),
     )
 
     page_three = DocumentPage(
         number=3,
-        content=[
+        content=(
             "Datos de interés de los equipos participantes",
             "REAL TAJO Contacto: JUAN",
             "28300 Aranjuez (Madrid)",
@@ -211,17 +212,21 @@ def _build_sample_document() -> ParsedDocument:
             "Camiseta: Azul Pantalón: Azul Medias: Blancas",
             "2ª Equipación",
             "Camiseta: - Pantalon: - Medias: -",
-        ],
+        ),
     )
 
-    return ParsedDocument(pages=[page_one, page_two, page_three])
+    return ParsedDocument(pages=(page_one, page_two, page_three))
 
 
-def test_parser_extracts_real_tajo_calendar() -> None:
+_SAMPLE_DOCUMENT = _build_sample_document()
+
+
+def test_parser_extracts_real_tajo_calendar(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure the parser extracts the Real Tajo schedule and team information."""
 
-    document = _build_sample_document()
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(_SAMPLE_DOCUMENT))
 
     calendar = parser.parse(b"binary")
 
@@ -253,16 +258,18 @@ def test_parser_extracts_real_tajo_calendar() -> None:
     assert team_info.first_kit.socks == "Blancas"
 
 
-def test_parser_handles_inline_matchdays_and_multiple_matches_per_line() -> None:
+def test_parser_handles_inline_matchdays_and_multiple_matches_per_line(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Validate the parser when matchdays and fixtures are condensed in a single line."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "AFICIONADOS F-11",
                     "1.- NUEVO (1054)",
@@ -270,30 +277,30 @@ def test_parser_handles_inline_matchdays_and_multiple_matches_per_line() -> None
                     "3.- REAL TAJO (1048)",
                     "4.- AMERICA (1052)",
                     "5.- REAL SPORT (1047)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta Jornada 1 (11-10-2025) NUEVO - AMERICA REAL TAJO - RACING ARANJUEZ",
                     "Segunda Vuelta Jornada 10 (31-01-2026) RACING ARANJUEZ - REAL TAJO REAL SPORT - CELTIC C.F.",
-                ],
+                ),
             ),
             DocumentPage(
                 number=3,
-                content=[
+                content=(
                     "Datos de interés de los equipos participantes",
                     "REAL TAJO Contacto: JUAN",
                     "Teléfono: 620763145",
                     "Primera Equipación",
                     "Tipo Camiseta: Lisa Tipo Pantalón: Base Tipo Medias: Base",
                     "Camiseta: Azul Pantalón: Azul Medias: Blancas",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"inline")
 
@@ -311,31 +318,33 @@ def test_parser_handles_inline_matchdays_and_multiple_matches_per_line() -> None
     assert second_match.opponent == "RACING ARANJUEZ"
 
 
-def test_parser_accepts_matches_without_spaces_around_separator() -> None:
+def test_parser_accepts_matches_without_spaces_around_separator(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure fixtures using tight hyphen separators are still detected."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Equipos Participantes",
                     "1.- REAL SPORT (1047)",
                     "2.- REAL TAJO (1048)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 2 (18-10-2025)",
                     "REAL SPORT-REAL TAJO",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"compact-separator")
 
@@ -346,33 +355,35 @@ def test_parser_accepts_matches_without_spaces_around_separator() -> None:
     assert match.is_home is False
 
 
-def test_parser_handles_en_dash_separators() -> None:
+def test_parser_handles_en_dash_separators(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure fixtures using typographic dashes are correctly processed."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Equipos Participantes",
                     "1.- REAL TAJO (1048)",
                     "2.- REAL SPORT (1047)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 4 (08-11-2025)",
                     "REAL SPORT – REAL TAJO",
                     "Jornada 5 (15-11-2025)",
                     "REAL TAJO — REAL SPORT",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"en-dash")
 
@@ -382,38 +393,40 @@ def test_parser_handles_en_dash_separators() -> None:
     }
 
 
-def test_parser_infers_stage_when_headers_are_missing() -> None:
+def test_parser_infers_stage_when_headers_are_missing(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure the parser derives stage names when the PDF omits explicit headers."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- REAL SPORT (1047)",
                     "2.- REAL TAJO (1048)",
                     "3.- AMERICA (1052)",
                     "4.- RACING ARANJUEZ (1019)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Jornada 1 (11-10-2025) Campo Fecha / Hora",
                     "REAL SPORT - REAL TAJO ENRIQUE MORENO - B (HA) 11-10-2025 - 15:30",
                     "AMERICA - RACING ARANJUEZ CAMPO CENTRAL 11-10-2025 - 17:00",
                     "Jornada 10 (31-01-2026) Campo Fecha / Hora",
                     "REAL TAJO - REAL SPORT ENRIQUE MORENO - B (HA) 31-01-2026 - 17:30",
                     "RACING ARANJUEZ - AMERICA CAMPO CENTRAL 31-01-2026 - 19:30",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"stages-missing")
 
@@ -437,16 +450,18 @@ def test_parser_infers_stage_when_headers_are_missing() -> None:
     assert second_match.field == "ENRIQUE MORENO - B (HA)"
 
 
-def test_parser_supports_multiline_team_names_in_participants_section() -> None:
+def test_parser_supports_multiline_team_names_in_participants_section(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure the parser recognises team names split across multiple lines."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- LA VESPA TAPAS-CLUB ATLETICO DE",
                     "ARANJUEZ (1001)",
@@ -454,26 +469,26 @@ def test_parser_supports_multiline_team_names_in_participants_section() -> None:
                     "TAJO (1002)",
                     "3.- IRT ARANJUEZ (1003)",
                     "4.- REAL TAJO (1004)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 1 (11-10-2025)",
-                    "LA VESPA TAPAS-CLUB ATLETICO DE",
+                    _VESPA,
                     "ARANJUEZ - REAL TAJO",
                     "Jornada 2 (18-10-2025)",
                     "REAL TAJO - AMG-ASESORIA JURIDICA- EXCAVACIONES",
-                    "TAJO",
+                    _TAJO,
                     "Jornada 3 (25-10-2025)",
                     "IRT ARANJUEZ - REAL TAJO",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"multiline")
 
@@ -485,26 +500,28 @@ def test_parser_supports_multiline_team_names_in_participants_section() -> None:
     }
 
 
-def test_parser_matches_teams_even_when_schedule_uses_accents() -> None:
+def test_parser_matches_teams_even_when_schedule_uses_accents(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Verify fixtures are captured despite accent differences between sections."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- AMERICA (1052)",
                     "2.- AMG-ASESORIA JURIDICA- EXCAVACIONES TAJO (1027)",
                     "3.- IRT ARANJUEZ (1049)",
                     "4.- REAL TAJO (1048)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 1 (11-10-2025)",
                     "AMÉRICA - REAL TAJO",
@@ -512,12 +529,12 @@ def test_parser_matches_teams_even_when_schedule_uses_accents() -> None:
                     "REAL TAJO - AMG-ASESORIA JURÍDICA- EXCAVACIONES TAJO",
                     "Jornada 3 (25-10-2025)",
                     "IRT ARANJUEZ - REAL TAJO",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"accents")
 
@@ -531,34 +548,36 @@ def test_parser_matches_teams_even_when_schedule_uses_accents() -> None:
     ]
 
 
-def test_parser_recovers_matches_when_participants_are_incomplete() -> None:
+def test_parser_recovers_matches_when_participants_are_incomplete(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure Real Tajo fixtures are still parsed even if opponents are missing from participants."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- REAL TAJO (1048)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 1 (11-10-2025)",
                     "AMERICA - REAL TAJO",
                     "Jornada 2 (18-10-2025)",
                     "REAL TAJO - AMG-ASESORIA JURIDICA- EXCAVACIONES TAJO",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"fallback-teams")
 
@@ -571,23 +590,25 @@ def test_parser_recovers_matches_when_participants_are_incomplete() -> None:
     ]
 
 
-def test_parser_understands_matchdays_with_separated_dates() -> None:
+def test_parser_understands_matchdays_with_separated_dates(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure the parser links matchdays to dates even when they are split across lines."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Equipos Participantes",
                     "1.- REAL TAJO (1048)",
                     "2.- LA VESPA TAPAS-CLUB ATLETICO DE ARANJUEZ (1028)",
                     "3.- CELTIC C.F. (1024)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 13",
                     "(14-03-2026)",
@@ -595,12 +616,12 @@ def test_parser_understands_matchdays_with_separated_dates() -> None:
                     "Jornada 14",
                     "(21-03-2026)",
                     "CELTIC C.F. - REAL TAJO",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"split-date")
 
@@ -613,16 +634,18 @@ def test_parser_understands_matchdays_with_separated_dates() -> None:
     ]
 
 
-def test_parser_ignores_noise_and_recovers_real_tajo_pairings() -> None:
+def test_parser_ignores_noise_and_recovers_real_tajo_pairings(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure noisy jornada lines still yield the correct Real Tajo fixture."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- REAL SPORT (1047)",
                     "2.- REAL TAJO (1048)",
@@ -631,11 +654,11 @@ def test_parser_ignores_noise_and_recovers_real_tajo_pairings() -> None:
                     "5.- AMG-ASESORIA JURIDICA- EXCAVACIONES TAJO (1027)",
                     "6.- CELTIC C.F. (1024)",
                     "7.- ALBIRROJA (1050)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 1 (11-10-2025)",
                     "REAL SPORT - REAL TAJO",
@@ -655,22 +678,22 @@ def test_parser_ignores_noise_and_recovers_real_tajo_pairings() -> None:
                     "Descansa - ALBIRROJA AMG-ASESORIA JURIDICA- EXCAVACIONES TAJO – REAL TAJO",
                     "Jornada 17 (09-05-2026)",
                     "IRT ARANJUEZ – CELTIC C.F. REAL TAJO – AMERICA Descansa - ALBIRROJA",
-                ],
+                ),
             ),
             DocumentPage(
                 number=3,
-                content=[
+                content=(
                     "Datos de interés de los equipos participantes",
                     "REAL TAJO Contacto: JUAN",
                     "Teléfono: 620763145",
                     "Primera Equipación",
                     "Camiseta: Azul Pantalón: Azul Medias: Blancas",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"noisy-lines")
 
@@ -689,28 +712,30 @@ def test_parser_ignores_noise_and_recovers_real_tajo_pairings() -> None:
     ]
 
 
-def test_parse_calendar_with_field_and_time_columns() -> None:
+def test_parse_calendar_with_field_and_time_columns(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Parse calendars that include field and kick-off information per fixture."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- REAL SPORT (1001)",
                     "2.- REAL TAJO (1002)",
                     "3.- AMERICA (1003)",
                     "DELEGACION ZONAL DE ARANJUEZ R.F.F.M.",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Primera Vuelta",
                     "Jornada 1 (11-10-2025) Campo Fecha / Hora",
                     "Descansa - AMERICA",
@@ -718,12 +743,12 @@ def test_parse_calendar_with_field_and_time_columns() -> None:
                     "Jornada 2 (18-10-2025) Campo Fecha / Hora",
                     "REAL TAJO - AMERICA Campo Municipal 25-10-2025",
                     "DELEGACION ZONAL DE ARANJUEZ R.F.F.M.",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"field-and-time")
 
@@ -743,38 +768,40 @@ def test_parse_calendar_with_field_and_time_columns() -> None:
     ]
 
 
-def test_parser_does_not_leak_datetime_from_other_matches() -> None:
+def test_parser_does_not_leak_datetime_from_other_matches(
+    stub_document_parser: Callable[[ParsedDocument], DocumentParser],
+) -> None:
     """Ensure the parser assigns the correct kick-off to the Real Tajo fixture."""
 
     document = ParsedDocument(
-        pages=[
+        pages=(
             DocumentPage(
                 number=1,
-                content=[
+                content=(
                     "Calendario de Competiciones",
-                    "LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11 Temporada 2025-2026",
+                    _COMPETITION_HEADER,
                     "Equipos Participantes",
                     "1.- REAL SPORT (1001)",
                     "2.- AMERICA (1002)",
                     "3.- ALBIRROJA (1003)",
                     "4.- RACING ARANJUEZ (1004)",
                     "5.- REAL TAJO (1005)",
-                ],
+                ),
             ),
             DocumentPage(
                 number=2,
-                content=[
+                content=(
                     "Primera Vuelta",
                     "Jornada 3 (25-10-2025) Campo Fecha / Hora",
                     "REAL SPORT - IRT ARANJUEZ CAMPO A 25-10-2025 - 09:00",
                     "REAL TAJO - AMERICA CAMPO B 25-10-2025 - 11:30",
                     "RACING ARANJUEZ - ALBIRROJA CAMPO C 25-10-2025 - 13:00",
-                ],
+                ),
             ),
-        ]
+        )
     )
 
-    parser = RealTajoCalendarPdfParser(document_parser=_StubDocumentParser(document))
+    parser = RealTajoCalendarPdfParser(document_parser=stub_document_parser(document))
 
     calendar = parser.parse(b"avoid-leak")
 
@@ -3,44 +3,48 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pytest
+from app.config.settings import Settings, get_settings, resolve_data_dir
 
-from app.config.settings import get_settings
 
-
-@pytest.fixture(autouse=True)
-def clear_env(monkeypatch):
-    """Ensure environment variables are cleared between tests."""
-    monkeypatch.delenv("UPLOAD_DIR", raising=False)
-    monkeypatch.delenv("WEBSITE_INSTANCE_ID", raising=False)
-    monkeypatch.delenv("APP_DATA_DIR", raising=False)
-    yield
-
-
-def test_get_settings_uses_upload_dir_overrides(monkeypatch):
+def test_resolve_data_dir_uses_upload_dir_overrides() -> None:
     """When UPLOAD_DIR is defined it must take precedence over Azure defaults."""
-    monkeypatch.setenv("UPLOAD_DIR", "/tmp/custom-data")
-    monkeypatch.setenv("WEBSITE_INSTANCE_ID", "azure-instance")
 
-    settings = get_settings()
+    data_dir = resolve_data_dir(
+        {"UPLOAD_DIR": "/tmp/custom-data", "WEBSITE_INSTANCE_ID": "azure-instance"}
+    )
 
-    assert settings.data_dir == Path("/tmp/custom-data")
+    assert data_dir == Path("/tmp/custom-data")
 
 
-def test_get_settings_defaults_to_azure_persistent_storage(monkeypatch):
+def test_resolve_data_dir_defaults_to_azure_persistent_storage() -> None:
     """Azure environments should persist data under /home/site/data by default."""
-    monkeypatch.setenv("WEBSITE_INSTANCE_ID", "azure-instance")
 
-    settings = get_settings()
+    data_dir = resolve_data_dir({"WEBSITE_INSTANCE_ID": "azure-instance"})
 
-    assert settings.data_dir == Path("/home/site/data")
+    assert data_dir == Path("/home/site/data")
 
 
-def test_get_settings_allows_custom_azure_storage_path(monkeypatch):
+def test_resolve_data_dir_allows_custom_azure_storage_path() -> None:
     """A custom APP_DATA_DIR environment variable should override the Azure path."""
-    monkeypatch.setenv("WEBSITE_INSTANCE_ID", "azure-instance")
-    monkeypatch.setenv("APP_DATA_DIR", "/home/site/custom-path")
+
+    data_dir = resolve_data_dir(
+        {"WEBSITE_INSTANCE_ID": "azure-instance", "APP_DATA_DIR": "/home/site/custom-path"}
+    )
+
+    assert data_dir == Path("/home/site/custom-path")
+
+
+def test_resolve_data_dir_defaults_to_local_storage() -> None:
+    """Without storage variables the default local data directory should be used."""
+
+    assert resolve_data_dir({}) == Settings().data_dir
+
+
+def test_get_settings_reads_process_environment(monkeypatch) -> None:
+    """``get_settings`` should resolve the data directory from ``os.environ``."""
+
+    monkeypatch.setenv("UPLOAD_DIR", "/tmp/custom-data")
 
     settings = get_settings()
 
-    assert settings.data_dir == Path("/home/site/custom-path")
+    assert settings.data_dir == Path("/tmp/custom-data")
@@ -0,0 +1,72 @@
+"""Integration tests for the top scorers endpoints."""
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+_PAYLOAD = {
+    "metadata": {
+        "title": "Goleadores",
+        "competition": "LIGA AFICIONADOS F-11",
+        "category": "3ª AFICIONADOS F-11",
+        "season": "2025-2026",
+        "columns": [
+            {"key": "position", "label": "#"},
+            {"key": "player", "label": "Jugador"},
+            {"key": "team", "label": "Equipo"},
+            {"key": "group", "label": "Grupo"},
+            {"key": "matches_played", "label": "Partidos"},
+            {"key": "goals", "label": "Goles"},
+            {"key": "goals_per_match", "label": "Goles/Partido"},
+        ],
+    },
+    "rows": [
+        {
+            "position": 1,
+            "player": "MARIN MONTES, JUAN",
+            "team": "REAL TAJO",
+            "group": "3ª AFICIONADOS F-11",
+            "matches_played": 12,
+            "goals": {"total": 8, "details": "8 (1 de penalti)", "penalties": 1},
+            "goals_per_match": 0.6667,
+            "raw": ["MARIN MONTES, JUAN REAL TAJO 3ª AFICIONADOS F-11 12 8 0,6667"],
+        },
+        {
+            "position": 2,
+            "player": "PALLERO TUBIO, FRANCISCO JAVIER",
+            "team": "REAL TAJO",
+            "group": "3ª AFICIONADOS F-11",
+            "matches_played": 14,
+            "goals": {"total": 5, "details": None, "penalties": 0},
+            "goals_per_match": 0.3571,
+            "raw": [],
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize("path", ["/api/v1/top-scorers", "/api/v1/top-scorers/copa"])
+def test_upload_and_retrieve_top_scorers_table(client: TestClient, path: str) -> None:
+    """Uploading a top scorers table should persist it and allow retrieval."""
+
+    upload = client.put(path, json=_PAYLOAD)
+
+    assert upload.status_code == 200
+    assert upload.headers["Location"] == path
+    assert upload.json() == _PAYLOAD
+
+    retrieval = client.get(path)
+    assert retrieval.status_code == 200
+    assert retrieval.json() == _PAYLOAD
+
+
+@pytest.mark.parametrize("path", ["/api/v1/top-scorers", "/api/v1/top-scorers/copa"])
+def test_top_scorers_endpoints_return_not_found_when_empty(
+    client: TestClient, path: str
+) -> None:
+    """Retrieving a top scorers table before any upload should return ``404``."""
+
+    response = client.get(path)
+
+    assert response.status_code == 404
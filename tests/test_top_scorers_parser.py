@@ -1,57 +1,59 @@
 """Tests for the top scorers Excel parser."""
 from __future__ import annotations
 
-import sys
+from functools import lru_cache
 from io import BytesIO
+from pathlib import Path
 from types import ModuleType
-from typing import Iterable, List
+from typing import List, Tuple
 
 import pytest
-from openpyxl import Workbook
 
+from _fast_xlsx import build_xlsx
 from app.infrastructure.parsers.top_scorers_excel_parser import TopScorersExcelParser
 
+_SAMPLE_WORKBOOK = Path(__file__).parent / "data" / "top_scorers_sample.xlsx"
 
-def _build_workbook(rows: Iterable[Iterable[object]]) -> bytes:
-    """Return workbook bytes built from ``rows`` in the active worksheet."""
 
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.delete_rows(1, worksheet.max_row)
-    for row in rows:
-        worksheet.append(list(row))
-    buffer = BytesIO()
-    workbook.save(buffer)
-    return buffer.getvalue()
+@lru_cache(maxsize=None)
+def _build_workbook(rows: Tuple[Tuple[object, ...], ...]) -> bytes:
+    """Return workbook bytes built from ``rows`` in the first worksheet.
 
+    Results are memoised per ``rows`` so a sheet is only serialised once per run.
+    """
 
-def test_top_scorers_parser_extracts_entries() -> None:
-    """The parser should extract scorer entries and metadata from the spreadsheet."""
+    return build_xlsx(rows)
+
+
+def test_build_workbook_round_trips_through_read_only_openpyxl() -> None:
+    """Fixture workbooks should read back unchanged in openpyxl read-only mode."""
+
+    from openpyxl import load_workbook
+
+    rows = (
+        ("Jugador", "Equipo", None),
+        ("PLAYER & ONE", 2, 1.5),
+        (True,),
+    )
+
+    workbook = load_workbook(BytesIO(_build_workbook(rows)), read_only=True)
+    try:
+        read_back = list(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
 
-    rows: List[List[object]] = [
-        ["LIGA AFICIONADOS F-11, 2ª AFICIONADOS F-11"],
-        ["Temporada 2025-2026"],
-        ["Jugador", "Equipo", "Grupo", "Partidos Jugados", "Goles", "Goles partido"],
-        [
-            "BOCANEGRA CAIPA, JOHN DAIRO",
-            "CAFETERIA LA TACITA",
-            "2ª AFICIONADOS F-11",
-            3,
-            "4",
-            "1,3333",
-        ],
-        [
-            "ARRIAGA MARTINEZ, MANUEL",
-            "NEW COTTON MEKASO MCS",
-            "2ª AFICIONADOS F-11",
-            3,
-            "5 (2 de penalti)",
-            "1,6667",
-        ],
+    assert read_back == [
+        ("Jugador", "Equipo", None),
+        ("PLAYER & ONE", 2, 1.5),
+        (True, None, None),
     ]
 
+
+def test_top_scorers_parser_extracts_entries() -> None:
+    """The parser should extract scorer entries and metadata from the spreadsheet."""
+
     parser = TopScorersExcelParser()
-    table = parser.parse(_build_workbook(rows))
+    table = parser.parse(_SAMPLE_WORKBOOK.read_bytes())
 
     assert table.title == "LIGA AFICIONADOS F-11, 2ª AFICIONADOS F-11"
     assert table.competition == "LIGA AFICIONADOS F-11"
@@ -72,15 +74,29 @@ def test_top_scorers_parser_extracts_entries() -> None:
     assert second.goals_per_match == 1.3333
 
 
+def test_top_scorers_parser_accepts_binary_streams() -> None:
+    """Open file objects should be parsed without reading them into bytes first."""
+
+    parser = TopScorersExcelParser()
+    with _SAMPLE_WORKBOOK.open("rb") as stream:
+        table = parser.parse(stream)
+
+    assert table.season == "2025-2026"
+    assert [scorer.player for scorer in table.scorers] == [
+        "ARRIAGA MARTINEZ, MANUEL",
+        "BOCANEGRA CAIPA, JOHN DAIRO",
+    ]
+
+
 def test_top_scorers_parser_computes_ratio_when_missing() -> None:
     """The parser should derive goals per match when the column is empty."""
 
-    rows = [
-        ["LIGA AFICIONADOS F-11"],
-        ["Temporada 2025-2026"],
-        ["Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"],
-        ["PLAYER ONE", "TEAM", "GRUPO", 2, "4", ""],
-    ]
+    rows = (
+        ("LIGA AFICIONADOS F-11",),
+        ("Temporada 2025-2026",),
+        ("Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"),
+        ("PLAYER ONE", "TEAM", "GRUPO", 2, "4", ""),
+    )
 
     parser = TopScorersExcelParser()
     table = parser.parse(_build_workbook(rows))
@@ -94,13 +110,13 @@ def test_top_scorers_parser_computes_ratio_when_missing() -> None:
 def test_top_scorers_parser_accepts_decimal_separators() -> None:
     """The parser should accept ratios expressed with dots or commas."""
 
-    rows = [
-        ["LIGA AFICIONADOS F-11"],
-        ["Temporada 2025-2026"],
-        ["Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles/Partido"],
-        ["PLAYER ONE", "TEAM", "GRUPO", "2", "3", "1.5"],
-        ["PLAYER TWO", "TEAM", "GRUPO", "3", "3", "1,0"],
-    ]
+    rows = (
+        ("LIGA AFICIONADOS F-11",),
+        ("Temporada 2025-2026",),
+        ("Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles/Partido"),
+        ("PLAYER ONE", "TEAM", "GRUPO", "2", "3", "1.5"),
+        ("PLAYER TWO", "TEAM", "GRUPO", "3", "3", "1,0"),
+    )
 
     parser = TopScorersExcelParser()
     table = parser.parse(_build_workbook(rows))
@@ -110,6 +126,131 @@ def test_top_scorers_parser_accepts_decimal_separators() -> None:
     assert table.scorers[1].goals_per_match == 1.0
 
 
+def test_top_scorers_parser_shares_repeated_labels() -> None:
+    """Rows from the same team and group should reference the same label objects."""
+
+    rows = (
+        ("LIGA AFICIONADOS F-11",),
+        ("Temporada 2025-2026",),
+        ("Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"),
+        ("PLAYER ONE", "TEAM", "GRUPO", "2", "3", "1,5"),
+        ("PLAYER TWO", "TEAM", "GRUPO", "3", "3", "1,0"),
+    )
+
+    parser = TopScorersExcelParser()
+    first, second = parser.parse(_build_workbook(rows)).scorers
+
+    assert first.team is second.team
+    assert first.group is second.group
+
+
+def test_intern_label_skips_long_values() -> None:
+    """Only short labels should be added to the interpreter's intern table."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    short_first, short_second = ("".join(["TE", "AM"]) for _ in range(2))
+    long_first, long_second = (
+        "".join(["X"] * parser_module._INTERN_MAX_LENGTH) for _ in range(2)
+    )
+
+    assert parser_module._intern_label(short_first) is parser_module._intern_label(
+        short_second
+    )
+    assert parser_module._intern_label(long_first) is long_first
+    assert parser_module._intern_label(long_second) is long_second
+
+
+def test_top_scorers_parser_iterates_scorers_in_chunks() -> None:
+    """``iter_scorers`` should yield sheet-ordered batches of the requested size."""
+
+    rows = (
+        ("LIGA AFICIONADOS F-11, 3ª AFICIONADOS F-11",),
+        ("Temporada 2025-2026",),
+        ("Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"),
+        ("PLAYER ONE", "TEAM", "", "2", "1", ""),
+        ("PLAYER TWO", "TEAM", "GRUPO", "3", "3", ""),
+        ("PLAYER THREE", "TEAM", "GRUPO", "3", "2", ""),
+    )
+
+    parser = TopScorersExcelParser()
+    chunks = list(parser.iter_scorers(_build_workbook(rows), chunk_size=2))
+
+    assert [[scorer.player for scorer in chunk] for chunk in chunks] == [
+        ["PLAYER ONE", "PLAYER TWO"],
+        ["PLAYER THREE"],
+    ]
+    assert chunks[0][0].group == "3ª AFICIONADOS F-11"
+    with pytest.raises(ValueError, match="chunk_size"):
+        parser.iter_scorers(_build_workbook(rows), chunk_size=0)
+
+
+@pytest.mark.negative
+def test_top_scorers_parser_iter_scorers_rejects_unknown_documents() -> None:
+    """``iter_scorers`` should reject unreadable documents at the call site."""
+
+    with pytest.raises(ValueError, match="could not be parsed"):
+        TopScorersExcelParser().iter_scorers(b"garbage")
+
+
+def test_top_scorers_parser_normalizes_header_separators() -> None:
+    """Slashes and non-breaking spaces in headers should not hide a column."""
+
+    rows = (
+        ("LIGA AFICIONADOS F-11",),
+        ("Temporada 2025-2026",),
+        ("Jugador", "Equipo", "Grupo", "Partidos\xa0Jugados", "Goles", "Goles / Partido"),
+        ("PLAYER ONE", "TEAM", "GRUPO", "2", "3", "1,5"),
+    )
+
+    parser = TopScorersExcelParser()
+    table = parser.parse(_build_workbook(rows))
+
+    scorer = table.scorers[0]
+    assert scorer.matches_played == 2
+    assert scorer.goals_per_match == 1.5
+
+
+@pytest.mark.negative
+def test_top_scorers_parser_requires_header() -> None:
+    """Sheets without the scorer header row should be rejected."""
+
+    html = (
+        "<table><tr><td>LIGA AFICIONADOS F-11</td></tr>"
+        "<tr><td>Temporada 2025-2026</td></tr>"
+        "<tr><td>PLAYER ONE</td><td>TEAM</td><td>GRUPO</td>"
+        "<td>2</td><td>4</td><td></td></tr></table>"
+    )
+
+    parser = TopScorersExcelParser()
+    with pytest.raises(ValueError, match="expected scorer headers"):
+        parser.parse(html.encode("utf-8"))
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("4", (4, None)),
+        (4.0, (4, None)),
+        ("5 (2 de penalti)", (5, 2)),
+        ("8 (1 De Penaltis)", (8, 1)),
+        ("8 - 1 de penalti", (8, 1)),
+        ("Goles: 3", (3, None)),
+        ("", (None, None)),
+    ],
+)
+def test_parse_goals_cell_extracts_totals_and_penalties(
+    raw: object, expected: Tuple[int | None, int | None]
+) -> None:
+    """Goal cells should yield the total and penalty goals in every known layout."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    total, penalties, _ = parser_module._parse_goals_cell(raw)
+
+    assert (total, penalties) == expected
+
+
 def test_top_scorers_parser_reads_html_xls_documents() -> None:
     """The parser should handle HTML tables saved with an XLS extension."""
 
@@ -170,7 +311,7 @@ def test_top_scorers_parser_preserves_trailing_cells_in_xls(monkeypatch) -> None
     rows = [header, data]
 
     def fake_load_workbook(*_args: object, **_kwargs: object) -> None:
-        raise ValueError("legacy xls")
+        pytest.fail("non-ZIP documents should skip openpyxl")
 
     def fake_loader(document_bytes: bytes) -> List[List[object]]:
         assert document_bytes == b"fake-xls"
@@ -189,6 +330,104 @@ def test_top_scorers_parser_preserves_trailing_cells_in_xls(monkeypatch) -> None
     assert scorer.goals_per_match == 2.0
 
 
+def test_top_scorers_parser_sends_markup_straight_to_html_loader(monkeypatch) -> None:
+    """HTML exports should skip the legacy XLS loaders entirely."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    def fail_loader(_document_bytes: bytes) -> List[List[object]]:
+        pytest.fail("markup documents should skip the XLS loaders")
+
+    monkeypatch.setattr(parser_module, "_XLS_LOADERS", [fail_loader])
+    html = (
+        "<table><tr><th>Jugador</th><th>Equipo</th><th>Grupo</th>"
+        "<th>Partidos</th><th>Goles</th><th>Goles partido</th></tr>"
+        "<tr><td>PLAYER ONE</td><td>TEAM</td><td>GRUPO</td>"
+        "<td>2</td><td>4</td><td>2</td></tr></table>"
+    )
+
+    table = TopScorersExcelParser().parse(b"\xef\xbb\xbf\r\n  " + html.encode("utf-8"))
+
+    assert [scorer.player for scorer in table.scorers] == ["PLAYER ONE"]
+
+
+def test_load_with_html_rejects_non_html_documents() -> None:
+    """The HTML loader should refuse bytes that carry no table markup."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    with pytest.raises(ValueError, match="not an HTML table"):
+        parser_module._load_with_html(b"fake")
+
+
+def test_load_with_html_rejects_markup_without_tables() -> None:
+    """Markup without a populated table should be rejected."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    with pytest.raises(ValueError, match="not an HTML table"):
+        parser_module._load_with_html(b"<html><body><p>Sin datos</p></body></html>")
+    with pytest.raises(ValueError, match="No tables were found"):
+        parser_module._load_with_html(b"<html><body><table></table></body></html>")
+
+
+@pytest.mark.negative
+def test_top_scorers_parser_sends_ole_documents_to_xls_loaders_only(monkeypatch) -> None:
+    """OLE documents rejected by the XLS loaders should never reach the HTML loader."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    def reject_loader(_document_bytes: bytes) -> List[List[object]]:
+        raise ValueError("not an XLS workbook")
+
+    def fail_html_loader(_document_bytes: bytes) -> List[List[object]]:
+        pytest.fail("OLE documents should skip the HTML loader")
+
+    monkeypatch.setattr(parser_module, "_XLS_LOADERS", [reject_loader])
+    monkeypatch.setattr(parser_module, "_load_with_html", fail_html_loader)
+
+    with pytest.raises(ValueError, match="could not be parsed"):
+        TopScorersExcelParser().parse(b"\xd0\xcf\x11\xe0fake-ole")
+
+
+def test_top_scorers_parser_reads_streams_from_their_position(monkeypatch) -> None:
+    """Streams should be sniffed and read from the caller's current offset."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    rows = [
+        ["Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"],
+        ["PLAYER ONE", "TEAM", "GRUPO", 2, "4", ""],
+    ]
+
+    def fake_loader(document_bytes: bytes) -> List[List[object]]:
+        assert document_bytes == b"\xd0\xcf\x11\xe0fake-ole"
+        return [list(row) for row in rows]
+
+    monkeypatch.setattr(parser_module, "_XLS_LOADERS", [fake_loader])
+    stream = BytesIO(b"prefix" + b"\xd0\xcf\x11\xe0fake-ole")
+    stream.seek(len(b"prefix"))
+
+    table = TopScorersExcelParser().parse(stream)
+
+    assert table.scorers[0].goals_total == 4
+
+
+def test_top_scorers_parser_reuses_discovered_loaders(monkeypatch) -> None:
+    """Parsing should rely on the loaders discovered at import time."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    def fail_import_module(name: str) -> ModuleType:
+        pytest.fail(f"unexpected import of {name} while parsing")
+
+    monkeypatch.setattr(parser_module, "import_module", fail_import_module)
+
+    table = TopScorersExcelParser().parse(_SAMPLE_WORKBOOK.read_bytes())
+
+    assert len(table.scorers) == 2
+
+
 def test_build_xls_loaders_prefers_supported_modules(monkeypatch) -> None:
     """The loader discovery should skip unsupported xlrd releases."""
 
@@ -203,8 +442,11 @@ def test_build_xls_loaders_prefers_supported_modules(monkeypatch) -> None:
         ncols = 1
 
         @staticmethod
-        def row_values(_index: int, end_colx: int | None = None) -> List[object]:
-            return ["value"] if end_colx else ["value"]
+        def row_values(
+            _index: int, start_colx: int = 0, end_colx: int | None = None
+        ) -> List[object]:
+            assert (start_colx, end_colx) == (0, 1)
+            return ["value"]
 
     class DummyBook:
         @staticmethod
@@ -227,10 +469,8 @@ def test_build_xls_loaders_prefers_supported_modules(monkeypatch) -> None:
 
     loaders = parser_module._build_xls_loaders()
 
-    assert len(loaders) == 2
-    assert loaders[0](b"fake") == [["value"]]
-    with pytest.raises(ValueError):
-        loaders[1](b"fake")
+    assert len(loaders) == 1
+    assert list(loaders[0](b"fake")) == [["value"]]
 
 
 def test_build_xls_loaders_uses_pyexcel_when_available(monkeypatch) -> None:
@@ -260,10 +500,74 @@ def test_build_xls_loaders_uses_pyexcel_when_available(monkeypatch) -> None:
 
     loaders = parser_module._build_xls_loaders()
 
-    assert len(loaders) == 2
+    assert len(loaders) == 1
     assert loaders[0](b"fake") == [
         ["Jugador", "Equipo", "Grupo"],
         ["NAME", "TEAM", "GROUP"],
     ]
-    with pytest.raises(ValueError):
-        loaders[1](b"fake")
+
+
+def test_build_calamine_loader_uses_calamine_when_available(monkeypatch) -> None:
+    """The calamine fast path should read the first sheet through python-calamine."""
+
+    from app.infrastructure.parsers import top_scorers_excel_parser as parser_module
+
+    rows = [
+        ["Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"],
+        ["PLAYER ONE", "TEAM", "GRUPO", 2.0, "4 (1 de penalti)", 2.0],
+    ]
+
+    class DummySheet:
+        @staticmethod
+        def to_python() -> List[List[object]]:
+            return rows
+
+    class DummyWorkbook:
+        @staticmethod
+        def from_filelike(stream: BytesIO) -> "DummyWorkbook":
+            assert stream.read() == b"PK\x03\x04fake-xlsx"
+            return DummyWorkbook()
+
+        @staticmethod
+        def get_sheet_by_index(index: int) -> DummySheet:
+            assert index == 0
+            return DummySheet()
+
+    calamine_module = ModuleType("python_calamine")
+    calamine_module.CalamineWorkbook = DummyWorkbook  # type: ignore[attr-defined]
+
+    def fake_import_module(name: str) -> ModuleType:
+        if name != "python_calamine":
+            raise ModuleNotFoundError(name)
+        return calamine_module
+
+    monkeypatch.setattr(parser_module, "import_module", fake_import_module)
+    loader = parser_module._build_calamine_loader()
+    assert loader is not None
+
+    monkeypatch.setattr(parser_module, "_CALAMINE_LOADER", loader)
+    table = parser_module.TopScorersExcelParser().parse(b"PK\x03\x04fake-xlsx")
+
+    scorer = table.scorers[0]
+    assert scorer.matches_played == 2
+    assert scorer.goals_total == 4
+    assert scorer.penalty_goals == 1
+    assert scorer.goals_per_match == 2.0
+
+
+def test_top_scorers_parser_reads_first_sheet_not_active_tab() -> None:
+    """openpyxl should read the first sheet, like calamine and the XLS loaders."""
+
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    workbook.active.append(("Jugador", "Equipo", "Grupo", "Partidos", "Goles", "Goles partido"))
+    workbook.active.append(("PLAYER ONE", "TEAM", "GRUPO", 2, "4", ""))
+    workbook.create_sheet("Notas").append(("Sin datos",))
+    workbook.active = 1
+    buffer = BytesIO()
+    workbook.save(buffer)
+
+    table = TopScorersExcelParser().parse(buffer.getvalue())
+
+    assert [scorer.player for scorer in table.scorers] == ["PLAYER ONE"]